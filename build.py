@@ -0,0 +1,55 @@
+"""Optional build step that compiles PokeSage's hottest pydantic model modules with Cython.
+
+PokeSage is a pure-python package, and its published wheels stay that way. For a training machine running from a
+checkout, `python build.py build_ext --inplace` compiles the modules in CYTHON_MODULES into extension modules next to
+their sources, which python then imports in place of the .py files. The compiled modules behave exactly like the python
+ones, so this is purely a local performance build, and deleting the generated .so files undoes it.
+
+The `build` function follows poetry's build script interface, so a platform-specific wheel can be produced by adding
+`script = "build.py"` under `[tool.poetry.build]` (plus `cython` and `setuptools` in the build requirements) and
+building with `POKESAGE_CYTHONIZE=1`.
+
+Note:
+    Annotation typing is turned off so that Cython leaves the pydantic field annotations alone, and function binding is
+    turned on so that the compiled classes keep the introspectable methods and signatures pydantic relies on.
+"""
+
+import os
+from typing import Any, Dict
+
+CYTHON_MODULES = [
+    "pokesage/battle/_compat.py",
+    "pokesage/battle/pokemon.py",
+    "pokesage/battle/state.py",
+    "pokesage/battle/utilities.py",
+]
+
+
+def build(setup_kwargs: Dict[str, Any]) -> None:
+    """Add the Cython extension modules to the setup arguments, if requested through POKESAGE_CYTHONIZE.
+
+    Args:
+        setup_kwargs (Dict[str, Any]): The setup arguments generated by poetry, updated in place.
+    """
+    if os.environ.get("POKESAGE_CYTHONIZE") != "1":
+        return
+
+    from Cython.Build import cythonize
+
+    setup_kwargs.update(
+        ext_modules=cythonize(
+            CYTHON_MODULES,
+            language_level=3,
+            compiler_directives={"annotation_typing": False, "binding": True},
+        ),
+        zip_safe=False,
+    )
+
+
+if __name__ == "__main__":
+    from setuptools import setup
+
+    os.environ.setdefault("POKESAGE_CYTHONIZE", "1")
+    setup_kwargs: Dict[str, Any] = {"name": "pokesage"}
+    build(setup_kwargs)
+    setup(**setup_kwargs)
@@ -2,14 +2,18 @@
 
 Classes:
     Battle: Class for storing battle data.
+    Gametype: IntEnum of the supported gametypes, valued by their slot count.
     BattleState: Class for storing battle state data.
+    BattleFlags: IntFlag of the once-per-battle mechanics used by each side, packed from a BattleState.
+    BattleColumns: Columnar numpy view of a battle's states, for analytics.
 """
 
-from .battle import Battle
+from .battle import Battle, Gametype
 from .choices import (
     AnyChoice,
     BattleChoice,
     DefaultChoice,
+    FlatBattleChoice,
     ForceSwitchChoice,
     ItemChoice,
     MoveChoice,
@@ -17,9 +21,13 @@ from .choices import (
     PassChoice,
     QuitChoice,
     ResignChoice,
+    SlotChoice,
     SwitchChoice,
     TeamChoice,
     TeamOrderChoice,
+    validate_any_choice,
+    validate_choice,
 )
-from .pokemon import BattleAbility, BattleItem, BattleMove, BattlePokemon, BoostBlock, StatBlock
-from .state import BattleState
+from .columns import BattleColumns
+from .pokemon import BattleAbility, BattleItem, BattleMove, BattlePokemon, BoostBlock, StatBlock, pokemon_id
+from .state import BattleFlags, BattleState
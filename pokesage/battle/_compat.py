@@ -0,0 +1,17 @@
+"""Settings shared by the battle model modules that depend on how PokeSage is being run."""
+
+import sys
+from typing import Any, Dict
+
+# Slotted dataclasses are only available from python 3.10 onwards
+DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _function_type_probe() -> None:
+    """Do nothing. Only exists so that the type of functions defined in this module can be found."""
+
+
+# Only matters for the opt-in Cython build (see build.py), which compiles this module alongside the battle model
+# modules. Their functions and methods then become cyfunctions instead of regular python functions, and pydantic has to
+# be told not to treat those as fields
+FUNCTION_TYPES = (type(_function_type_probe),)
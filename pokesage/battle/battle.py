@@ -11,16 +11,64 @@ Tip:
     each individual state in the battle.
 """
 
-from typing import List, Literal, Optional
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, List, Optional
 
-from poketypes.dex import DexGen
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
 from .choices import AnyChoice
+from .columns import BattleColumns
 from .state import BattleState
+from .trusted import TrustedConstructMixin
 
+if TYPE_CHECKING:
+    from poketypes.dex import DexGen
 
-class Battle(BaseModel):
+    DexGenValue = DexGen.ValueType
+else:
+    # DexGen.ValueType is an int NewType, so validate it as a plain int instead of importing the poketypes dex tables
+    DexGenValue = int
+
+
+class Gametype(IntEnum):
+    """The gametypes supported by PokeSage, valued by their number of battle slots per side.
+
+    Showdown sends gametypes as lowercase strings ("singles", "doubles", "triples"), which `from_showdown` and
+    `to_showdown` convert to and from. Battle accepts those strings when validating, and writes them back out in JSON.
+    """
+
+    SINGLES = 1
+    DOUBLES = 2
+    TRIPLES = 3
+
+    @classmethod
+    def from_showdown(cls, gametype: str) -> "Gametype":
+        """Convert a showdown gametype string into a Gametype.
+
+        Args:
+            gametype (str): The showdown gametype, e.g. "doubles".
+
+        Raises:
+            RuntimeError: If the gametype is not one PokeSage supports.
+
+        Returns:
+            Gametype: The corresponding Gametype.
+        """
+        try:
+            return cls[gametype.upper()]
+        except KeyError:
+            raise RuntimeError(f"Unknown gametype: {gametype}") from None
+
+    def to_showdown(self) -> str:
+        """Convert the Gametype into its showdown gametype string.
+
+        Returns:
+            str: The showdown gametype, e.g. "doubles".
+        """
+        return self.name.lower()
+
+
+class Battle(TrustedConstructMixin, BaseModel):
     """A full representation of a pokemon battle as a serializable object.
 
     One Battle contains multiple BattleStates in an ordered list.
@@ -51,12 +99,14 @@ class Battle(BaseModel):
         opponent_team_size: The integer team size of the opponent
     """
 
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
     battle_states: List[BattleState] = Field(
-        [],
+        default_factory=list,
         description="The ordered list of battle states as they were before a decision by the player",
     )
     battle_actions: List[AnyChoice] = Field(
-        [],
+        default_factory=list,
         description="The list of decisions the player made at each corresponding BattleState in battle_states",
     )
 
@@ -70,11 +120,9 @@ class Battle(BaseModel):
 
     rated: bool = Field(False, description="Whether this match is rated or not")
 
-    gametype: Optional[Literal["singles", "doubles", "triples"]] = Field(
-        None, description="The gametype of this battle"
-    )
+    gametype: Optional[Gametype] = Field(None, description="The gametype of this battle")
     format: Optional[str] = Field(None, description="The format of this match")
-    gen: Optional[DexGen.ValueType] = Field(None, description="The generation this battle format corresponds to")
+    gen: Optional[DexGenValue] = Field(None, description="The generation this battle format corresponds to")
     turn: int = Field(None, description="The current / total number of turns in this battle")
 
     player_victory: Optional[bool] = Field(None, description="Whether this resulted in the player's victory")
@@ -84,12 +132,76 @@ class Battle(BaseModel):
 
     error_end: bool = Field(False, description="Whether this battle ended due to an error")
 
+    @field_validator("gametype", mode="before")
+    @classmethod
+    def _parse_gametype(cls, value: Any) -> Any:
+        """Accept showdown gametype strings (e.g. "doubles") in addition to Gametype values.
+
+        Args:
+            value (Any): The gametype value being validated.
+
+        Returns:
+            Any: The value, converted to a Gametype if it was a string.
+        """
+        if isinstance(value, str):
+            return Gametype.from_showdown(value)
+        return value
+
+    @field_serializer("gametype", when_used="json")
+    def _serialize_gametype(self, gametype: Optional[Gametype]) -> Optional[str]:
+        """Write the gametype out as its showdown string in JSON, so saved battles keep their existing format.
+
+        Args:
+            gametype (Optional[Gametype]): The gametype to serialize.
+
+        Returns:
+            Optional[str]: The showdown gametype string, or None if no gametype is set.
+        """
+        return None if gametype is None else gametype.to_showdown()
+
+    def to_json(self) -> str:
+        """Serialize the battle to a compact JSON string, for logging or saving battles to disk.
+
+        Fields that are None are left out entirely, which removes most of the output for the mostly-empty Optional
+        fields on each BattleState and BattlePokemon. Since every Optional field defaults to None, loading the result
+        back with `model_validate_json` gives the same battle.
+
+        Returns:
+            str: The JSON representation of this battle
+        """
+        return self.model_dump_json(exclude_none=True)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the battle like `to_json`, but as UTF-8 encoded bytes, for writing straight to a binary file.
+
+        This goes through the same pydantic-core serializer as `to_json`, but skips decoding its output into a python
+        string, which would only be encoded again when written to disk.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON representation of this battle
+        """
+        return self.__pydantic_serializer__.to_json(self, exclude_none=True)
+
+    def to_columns(self) -> BattleColumns:
+        """Build a columnar numpy view of this battle's states, for vectorized analytics.
+
+        The columns are a snapshot, built on each call, so they won't reflect any battle states added afterwards.
+
+        Returns:
+            BattleColumns: One array per primitive BattleState field, indexed by battle state.
+        """
+        if self.gametype is not None:
+            slot_length = self.slot_length()
+        else:
+            slot_length = max([len(state.player_slots) for state in self.battle_states] + [1])
+
+        return BattleColumns.from_states(self.battle_states, slot_length)
+
     def slot_length(self) -> int:
         """Identify the slot length based on the gametype.
 
         Raises:
             RuntimeError: If the gametype is not initialized, this function will fail.
-            RuntimeError: If the gametype is somehow not one of the expected values, this function will fail.
 
         Returns:
             int: The integer number of slots for this gametype
@@ -97,11 +209,4 @@ class Battle(BaseModel):
         if self.gametype is None:
             raise RuntimeError("slot_length was called but no gametype was set!")
 
-        if self.gametype == "singles":
-            return 1
-        if self.gametype == "doubles":
-            return 2
-        if self.gametype == "triples":
-            return 3
-
-        raise RuntimeError(f"Unknown gametype: {self.gametype}")
+        return int(self.gametype)
@@ -1,27 +1,81 @@
-"""Pydantic BaseModels for choices the player can make in a battle.
+"""Pydantic BaseModels and dataclasses for choices the player can make in a battle.
 
-In addition to the BaseModels, this module also contains type aliases for the various types of choices that can be made.
-Be careful when using these type aliases, as the standard isinstance() function will not work on them. Instead, use
-beartypes or some other type-checking library to ensure that the choice you are given is the one you expect.
+Choices that carry data needing validation are pydantic BaseModels, while the small fixed-shape choices (switching,
+passing, resigning, etc) are frozen, slotted dataclasses, which are much cheaper to create and hold in memory. Pydantic
+still validates and serializes the dataclasses wherever they appear in a model.
+
+In addition to the choice classes, this module also contains type aliases for the various types of choices that can be
+made. Be careful when using these type aliases, as the standard isinstance() function will not work on them. Instead,
+use beartypes or some other type-checking library to ensure that the choice you are given is the one you expect.
+
+Every choice carries a constant `choice_type` tag, which the type aliases use as a pydantic discriminator. This lets
+pydantic jump straight to the right model when validating a choice, instead of trying each union member in turn, and
+keeps otherwise-empty choices like PassChoice distinguishable once serialized.
 """
 
-from beartype.typing import List, Optional, Union
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+from typing import TYPE_CHECKING, Annotated, Any, List, Literal, Optional, Tuple, Union
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from ._compat import DATACLASS_OPTIONS
+from .trusted import TrustedConstructMixin
+
+if TYPE_CHECKING:
+    from poketypes.dex import DexMoveTarget
+
+    DexMoveTargetValue = DexMoveTarget.ValueType
+else:
+    # DexMoveTarget.ValueType is an int NewType, so validate it as a plain int instead of importing the poketypes dex
+    # tables
+    DexMoveTargetValue = int
+
+
+def _build_move_suffixes() -> Tuple[str, ...]:
+    """Build the showdown suffix for every combination of MoveChoice extra-action flags.
+
+    Returns:
+        Tuple[str, ...]: The 16 suffixes, indexed by the flags packed as `tera << 3 | mega << 2 | dyna << 1 | zmove`
+    """
+    suffixes = []
+    for tera, mega, dyna, zmove in product((False, True), repeat=4):
+        suffix = ""
+        if tera:
+            suffix += " terastallize"
+        if mega:
+            suffix += " mega"
+        if dyna:
+            suffix += " dynamax"
+        if zmove:
+            suffix += " zmove"
+        suffixes.append(suffix)
+
+    return tuple(suffixes)
 
-from pydantic import BaseModel, Field
 
-from poketypes.dex import DexMoveTarget
+_MOVE_SUFFIXES = _build_move_suffixes()
 
 
-class TeamChoice(BaseModel):
+class TeamChoice(TrustedConstructMixin, BaseModel):
     """Base Model representing a team order decision.
 
-    When initialized, team_order will be in sorted order. As a response to this Choice, the player should sort the
-    team_order list in the order they want their pokemon to be in.
+    When initialized, team_order will be in sorted order. As a response to this Choice, the player should create a new
+    TeamChoice with the team_order list in the order they want their pokemon to be in.
+
+    Note:
+        Choices are frozen, so don't modify team_order in place.
 
     Attributes:
+        choice_type: The tag identifying this type of choice
         team_order: A list of integer pokemon slots in the order you want them.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
+    choice_type: Literal["team"] = Field("team", description="The tag identifying this type of choice")
+
     team_order: List[int] = Field(
         ...,
         description="A list of integer pokemon slots in the order you want them.",
@@ -33,18 +87,16 @@ class TeamChoice(BaseModel):
         Returns:
             str: The showdown-formatted decision
         """
-        if len(self.team_order) >= 10:
-            return "team " + ",".join([str(s) for s in self.team_order])
-        else:
-            return "team " + "".join([str(s) for s in self.team_order])
+        return "team " + ",".join(map(str, self.team_order))
 
 
-class MoveChoice(BaseModel):
+class MoveChoice(TrustedConstructMixin, BaseModel):
     """Base Model representing a single move option for a pokemon.
 
     Contains information about move, target, and any extra move actions.
 
     Attributes:
+        choice_type: The tag identifying this type of choice
         move_number: The 1-indexed position of the move
         target_number: The 1-indexed target of the move, if needed.
         target_type: The target type of the move. Can be None if you can't target anything. (Locked into Outrage, etc)
@@ -54,10 +106,14 @@ class MoveChoice(BaseModel):
         zmove: Whether this choice is using the zmove form of the move
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
+    choice_type: Literal["move"] = Field("move", description="The tag identifying this type of choice")
+
     move_number: int = Field(..., description="The 1-indexed position of the move")
 
-    target_type: Optional[DexMoveTarget.ValueType] = Field(
-        ...,
+    target_type: Optional[DexMoveTargetValue] = Field(
+        None,
         description="The target type of the move. Can be None if you can't target anything. (Locked into Outrage, etc)",
     )
 
@@ -74,32 +130,24 @@ class MoveChoice(BaseModel):
         Returns:
             str: The showdown-formatted decision
         """
-        choice = f"move {self.move_number}"
-
-        if self.target_number is not None:
-            choice += f" {self.target_number}"
-        if self.tera:
-            choice += " terastallize"
-        if self.mega:
-            choice += " mega"
-        if self.dyna:
-            choice += " dynamax"
-        if self.zmove:
-            choice += " zmove"
+        flags = self.tera << 3 | self.mega << 2 | self.dyna << 1 | self.zmove
+        target = "" if self.target_number is None else f" {self.target_number}"
+        return f"move {self.move_number}{target}{_MOVE_SUFFIXES[flags]}"
 
-        return choice.strip()
 
-
-class SwitchChoice(BaseModel):
-    """Base Model representing a switch-out option for a pokemon.
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
+class SwitchChoice:
+    """Dataclass representing a switch-out option for a pokemon.
 
     Contains information about target switch slot number
 
     Attributes:
         slot: The slot to switch to
+        choice_type: The tag identifying this type of choice
     """
 
-    slot: int = Field(..., description="The slot to switch to")
+    slot: int
+    choice_type: Literal["switch"] = "switch"
 
     def to_showdown(self) -> str:
         """Convert the choice to a showdown-formatted decision.
@@ -107,20 +155,23 @@ class SwitchChoice(BaseModel):
         Returns:
             str: The showdown-formatted decision
         """
-        choice = f"switch {self.slot}"
-
-        return choice.strip()
+        return f"switch {self.slot}"
 
 
-class ItemChoice(BaseModel):
-    """
-    Data Model representing a item-use option for a pokemon.
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
+class ItemChoice:
+    """Dataclass representing a item-use option for a pokemon.
 
     Contains information about target and which item to use.
 
     Unused for showdown. Reserved for future emulator interaction
+
+    Attributes:
+        choice_type: The tag identifying this type of choice
     """
 
+    choice_type: Literal["item"] = "item"
+
     def to_showdown(self) -> str:
         """Convert the choice to a showdown-formatted decision.
 
@@ -133,13 +184,19 @@ class ItemChoice(BaseModel):
         raise NotImplementedError
 
 
-class PassChoice(BaseModel):
-    """Base Model representing that this slot doesn't need to do anything, and thus passes.
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
+class PassChoice:
+    """Dataclass representing that this slot doesn't need to do anything, and thus passes.
 
     Contains no extra information, and while we could design our system to not need this,
     it makes action shapes consistent to require it
+
+    Attributes:
+        choice_type: The tag identifying this type of choice
     """
 
+    choice_type: Literal["pass"] = "pass"
+
     def to_showdown(self) -> str:
         """Convert the choice to a showdown-formatted decision.
 
@@ -149,13 +206,19 @@ class PassChoice(BaseModel):
         return "pass"
 
 
-class ResignChoice(BaseModel):
-    """Base Model representing the option to resign.
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
+class ResignChoice:
+    """Dataclass representing the option to resign.
 
     Used for type-hinting consistency, and for connectors to gracefully terminate when a sage-class fails for this
     individual battle, but not irrecoverably for all battles.
+
+    Attributes:
+        choice_type: The tag identifying this type of choice
     """
 
+    choice_type: Literal["resign"] = "resign"
+
     def to_showdown(self) -> str:
         """Convert the choice to a showdown-formatted decision.
 
@@ -165,12 +228,18 @@ class ResignChoice(BaseModel):
         return "forfeit"
 
 
-class QuitChoice(BaseModel):
-    """Base Model representing the option to resign all games and close connection.
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
+class QuitChoice:
+    """Dataclass representing the option to resign all games and close connection.
 
     Used for type-hinting consistency, and for connectors to gracefully terminate when a sage-class fails irrecoverably.
+
+    Attributes:
+        choice_type: The tag identifying this type of choice
     """
 
+    choice_type: Literal["quit"] = "quit"
+
     def to_showdown(self) -> str:
         """Convert the choice to a showdown-formatted decision.
 
@@ -180,12 +249,18 @@ class QuitChoice(BaseModel):
         return "forfeit"
 
 
-class DefaultChoice(BaseModel):
-    """Base Model representing picking the first legal option.
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
+class DefaultChoice:
+    """Dataclass representing picking the first legal option.
 
     Used for type-hinting consistency, since the default option is always the first legal option.
+
+    Attributes:
+        choice_type: The tag identifying this type of choice
     """
 
+    choice_type: Literal["default"] = "default"
+
     def to_showdown(self) -> str:
         """Convert the choice to a showdown-formatted decision.
 
@@ -195,30 +270,132 @@ class DefaultChoice(BaseModel):
         return "default"
 
 
+SlotChoice = Annotated[Union[MoveChoice, SwitchChoice, ItemChoice, PassChoice], Field(discriminator="choice_type")]
+TeamOrderChoice = Annotated[
+    Union[TeamChoice, ResignChoice, DefaultChoice, QuitChoice], Field(discriminator="choice_type")
+]
+MoveDecisionChoice = Union[
+    list[SlotChoice],
+    Annotated[Union[ResignChoice, DefaultChoice, QuitChoice], Field(discriminator="choice_type")],
+]
+ForceSwitchChoice = Union[
+    list[Annotated[Union[SwitchChoice, PassChoice], Field(discriminator="choice_type")]],
+    Annotated[Union[ResignChoice, DefaultChoice, QuitChoice], Field(discriminator="choice_type")],
+]
+
 AnyChoice = Union[
-    List[Union[MoveChoice, SwitchChoice, ItemChoice, PassChoice]],
-    TeamChoice,
-    ResignChoice,
-    DefaultChoice,
-    QuitChoice,
+    list[SlotChoice],
+    TeamOrderChoice,
     None,
 ]
 BattleChoice = Union[
-    List[
+    list[
         Union[
-            List[Union[MoveChoice, SwitchChoice, ItemChoice],],
+            list[Annotated[Union[MoveChoice, SwitchChoice, ItemChoice], Field(discriminator="choice_type")]],
             PassChoice,
         ]
     ],
     TeamChoice,
 ]
 
-TeamOrderChoice = Union[TeamChoice, ResignChoice, DefaultChoice, QuitChoice]
-SlotChoice = Union[MoveChoice, SwitchChoice, ItemChoice, PassChoice]
-MoveDecisionChoice = Union[
-    List[SlotChoice],
-    ResignChoice,
-    DefaultChoice,
-    QuitChoice,
-]
-ForceSwitchChoice = Union[List[Union[SwitchChoice, PassChoice]], ResignChoice, DefaultChoice, QuitChoice]
+
+class FlatBattleChoice(TrustedConstructMixin, BaseModel):
+    """Base Model storing the list form of a BattleChoice as one flat tuple of choices plus slot offsets.
+
+    The nested form (a list per slot, or a PassChoice) needs pydantic to walk two layers of lists per battle state.
+    This stores the same choices in a single flat tuple, with the choices for slot `i` (0-indexed) being
+    `choices[slot_offsets[i]:slot_offsets[i + 1]]`. A slot that must pass is stored as its single PassChoice.
+
+    Attributes:
+        choices: Every slot's choices, one slot after another
+        slot_offsets: The start index of each slot's choices in `choices`, followed by the total number of choices
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
+
+    choices: Tuple[SlotChoice, ...] = Field(..., description="Every slot's choices, one slot after another")
+    slot_offsets: Tuple[int, ...] = Field(
+        ...,
+        description="The start index of each slot's choices in `choices`, followed by the total number of choices",
+    )
+
+    @classmethod
+    def from_nested(
+        cls, battle_choice: List[Union[List[Union[MoveChoice, SwitchChoice, ItemChoice]], PassChoice]]
+    ) -> "FlatBattleChoice":
+        """Flatten the nested list form of a BattleChoice.
+
+        Args:
+            battle_choice (List[Union[List[Union[MoveChoice, SwitchChoice, ItemChoice]], PassChoice]]): The nested
+                choices, with one entry per slot.
+
+        Returns:
+            FlatBattleChoice: The same choices, flattened.
+        """
+        choices = []
+        slot_offsets = [0]
+        for slot_choices in battle_choice:
+            if isinstance(slot_choices, PassChoice):
+                choices.append(slot_choices)
+            else:
+                choices.extend(slot_choices)
+            slot_offsets.append(len(choices))
+
+        return cls(choices=tuple(choices), slot_offsets=tuple(slot_offsets))
+
+    def per_slot(self) -> List[Union[List[Union[MoveChoice, SwitchChoice, ItemChoice]], PassChoice]]:
+        """Rebuild the nested list form of the BattleChoice, with one entry per slot.
+
+        Returns:
+            List[Union[List[Union[MoveChoice, SwitchChoice, ItemChoice]], PassChoice]]: The nested choices.
+        """
+        nested = []
+        for start, end in zip(self.slot_offsets, self.slot_offsets[1:]):
+            slot_choices = self.choices[start:end]
+            if len(slot_choices) == 1 and isinstance(slot_choices[0], PassChoice):
+                nested.append(slot_choices[0])
+            else:
+                nested.append(list(slot_choices))
+
+        return nested
+
+
+@lru_cache(maxsize=None)
+def _choice_adapter(choice_alias: Any) -> TypeAdapter:
+    """Build the TypeAdapter for a choice type alias, once per alias.
+
+    Args:
+        choice_alias (Any): One of the choice type aliases (or choice classes) in this module.
+
+    Returns:
+        TypeAdapter: The shared TypeAdapter for that alias.
+    """
+    return TypeAdapter(choice_alias)
+
+
+def validate_choice(data: Any, choice_alias: Any) -> Any:
+    """Validate raw data (e.g. a loaded JSON payload) as the given choice type alias.
+
+    The underlying pydantic validator is built on the first call for each alias and shared by every later call, instead
+    of being rebuilt for every payload.
+
+    Args:
+        data (Any): The data to validate, such as the python-mode dump of a choice.
+        choice_alias (Any): The choice type alias to validate against, e.g. BattleChoice.
+
+    Returns:
+        Any: The validated choice(s).
+    """
+    return _choice_adapter(choice_alias).validate_python(data)
+
+
+def validate_any_choice(data: Any) -> AnyChoice:
+    """Validate raw data (e.g. a loaded JSON payload) as an AnyChoice.
+
+    Args:
+        data (Any): The data to validate, such as the python-mode dump of a choice.
+
+    Returns:
+        AnyChoice: The validated choice(s).
+    """
+    return validate_choice(data, AnyChoice)
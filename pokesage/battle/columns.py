@@ -0,0 +1,156 @@
+"""Columnar (struct-of-arrays) views of a Battle, for analytics over many battle states.
+
+A Battle stores its history as a list of BattleState models, which is the right shape for building and serializing a
+battle one decision at a time, but a slow one for sweeping a single field across every state. BattleColumns instead
+stores each primitive field as one numpy array with one entry per battle state, so aggregations become vectorized
+reads over contiguous memory rather than a python loop over pydantic attribute accesses.
+
+Note:
+    numpy is an optional dependency of PokeSage. Install it with the `analytics` extra, e.g.
+    `pip install pokesage[analytics]`, to use this module. Importing this module works without numpy, but building
+    columns does not.
+
+Tip:
+    Missing values (no weather, an empty slot, an unknown hp, no status) are stored as -1, since the integer arrays
+    can't hold None.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .state import BattleState
+
+BOOST_NAMES = ("attack", "defence", "spattack", "spdefence", "speed", "accuracy", "evasion")
+
+
+def require_numpy() -> Any:
+    """Import numpy, which is an optional dependency of PokeSage.
+
+    Raises:
+        ImportError: If numpy is not installed.
+
+    Returns:
+        Any: The numpy module.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("This feature requires numpy. Install it with `pip install pokesage[analytics]`") from e
+
+    return numpy
+
+
+@dataclass
+class BattleColumns:
+    """A columnar view of the battle states of a Battle.
+
+    Every array's first axis is the index of the battle state, matching `Battle.battle_states`. Per-slot arrays have a
+    second axis of length `slot_length`, where index 0 is slot 1. Boost arrays have a third axis following BOOST_NAMES.
+
+    Attributes:
+        turn: The turn number of each battle state
+        weather: The DexWeather value of each battle state, or -1 if there is no weather
+        player_has_megad: Whether the player has mega evolved a pokemon
+        opponent_has_megad: Whether the opponent has mega evolved a pokemon
+        player_has_zmoved: Whether the player has used a zmove
+        opponent_has_zmoved: Whether the opponent has used a zmove
+        player_has_dynamaxed: Whether the player has dynamaxed a pokemon
+        opponent_has_dynamaxed: Whether the opponent has dynamaxed a pokemon
+        player_has_teratyped: Whether the player has teratyped a pokemon
+        opponent_has_teratyped: Whether the opponent has teratyped a pokemon
+        player_remaining: The number of the player's known pokemon that haven't fainted
+        opponent_remaining: The number of the opponent's known pokemon that haven't fainted
+        player_active_hp: The current hp of the player's pokemon in each slot
+        opponent_active_hp: The current hp of the opponent's pokemon in each slot
+        player_active_status: The DexStatus value of the player's pokemon in each slot
+        opponent_active_status: The DexStatus value of the opponent's pokemon in each slot
+        player_active_boosts: The stat boosts of the player's pokemon in each slot
+        opponent_active_boosts: The stat boosts of the opponent's pokemon in each slot
+    """
+
+    turn: "np.ndarray"
+    weather: "np.ndarray"
+
+    player_has_megad: "np.ndarray"
+    opponent_has_megad: "np.ndarray"
+    player_has_zmoved: "np.ndarray"
+    opponent_has_zmoved: "np.ndarray"
+    player_has_dynamaxed: "np.ndarray"
+    opponent_has_dynamaxed: "np.ndarray"
+    player_has_teratyped: "np.ndarray"
+    opponent_has_teratyped: "np.ndarray"
+
+    player_remaining: "np.ndarray"
+    opponent_remaining: "np.ndarray"
+
+    player_active_hp: "np.ndarray"
+    opponent_active_hp: "np.ndarray"
+    player_active_status: "np.ndarray"
+    opponent_active_status: "np.ndarray"
+    player_active_boosts: "np.ndarray"
+    opponent_active_boosts: "np.ndarray"
+
+    @classmethod
+    def from_states(cls, battle_states: List["BattleState"], slot_length: int) -> "BattleColumns":
+        """Build the columns from a list of battle states.
+
+        Args:
+            battle_states (List[BattleState]): The battle states to convert, in order.
+            slot_length (int): The number of battle slots per side.
+
+        Raises:
+            ImportError: If numpy is not installed.
+
+        Returns:
+            BattleColumns: The columnar view of the given battle states.
+        """
+        np = require_numpy()
+
+        n = len(battle_states)
+        flag_names = [
+            f"{side}_has_{flag}"
+            for flag in ("megad", "zmoved", "dynamaxed", "teratyped")
+            for side in ("player", "opponent")
+        ]
+
+        columns = {
+            "turn": np.empty(n, dtype=np.int16),
+            "weather": np.full(n, -1, dtype=np.int8),
+            **{name: np.zeros(n, dtype=np.bool_) for name in flag_names},
+        }
+        for side in ("player", "opponent"):
+            columns[f"{side}_remaining"] = np.zeros(n, dtype=np.uint8)
+            columns[f"{side}_active_hp"] = np.full((n, slot_length), -1, dtype=np.int16)
+            columns[f"{side}_active_status"] = np.full((n, slot_length), -1, dtype=np.int8)
+            columns[f"{side}_active_boosts"] = np.zeros((n, slot_length, len(BOOST_NAMES)), dtype=np.int8)
+
+        for i, state in enumerate(battle_states):
+            columns["turn"][i] = state.turn
+            if state.weather is not None:
+                columns["weather"][i] = state.weather
+            for name in flag_names:
+                columns[name][i] = getattr(state, name)
+
+            for side, team, slots in (
+                ("player", state.player_team, state.player_slots),
+                ("opponent", state.opponent_team, state.opponent_slots),
+            ):
+                columns[f"{side}_remaining"][i] = sum(1 for poke in team.values() if poke.cur_hp != 0)
+
+                for slot, poke_id in slots.items():
+                    poke = team.get(poke_id) if poke_id is not None else None
+                    if poke is None or not 1 <= slot <= slot_length:
+                        continue
+
+                    if poke.cur_hp is not None:
+                        columns[f"{side}_active_hp"][i, slot - 1] = poke.cur_hp
+                    if poke.status is not None:
+                        columns[f"{side}_active_status"][i, slot - 1] = poke.status
+                    columns[f"{side}_active_boosts"][i, slot - 1] = [
+                        getattr(poke.boosts, boost, 0) for boost in BOOST_NAMES
+                    ]
+
+        return cls(**columns)
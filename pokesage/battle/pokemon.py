@@ -1,30 +1,76 @@
-"""Pydantic BaseModels for Battling Pokemon.
+"""Pydantic BaseModels (and the dataclasses they are built from) for Battling Pokemon.
 
 Note that these BaseModels represent a specific instance of a Pokemon as it is in a battle. This is in contrast to the
 DexPokemon class, which is an Enum that represents a specific species of Pokemon, and to the PokedexPokemon class,
 which is a BaseModel that represents traits of a whole species of Pokemon.
 """
 
-from typing import List, Literal, Optional
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import TYPE_CHECKING, Annotated, List, Literal, Optional
 
-from poketypes.dex import (
-    DexAbility,
-    DexCondition,
-    DexItem,
-    DexMove,
-    DexPokemon,
-    DexStatus,
-    DexType,
-)
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass as pydantic_dataclass
 
+from ._compat import DATACLASS_OPTIONS, FUNCTION_TYPES
+from .columns import require_numpy
+from .trusted import TrustedConstructMixin
 
-class StatBlock(BaseModel):
-    """BaseModel for representing the min-max stats of a pokemon.
+if TYPE_CHECKING:
+    import numpy as np
+    from poketypes.dex import DexAbility, DexCondition, DexItem, DexMove, DexPokemon, DexStatus, DexType
+
+    DexAbilityValue = DexAbility.ValueType
+    DexConditionValue = DexCondition.ValueType
+    DexItemValue = DexItem.ValueType
+    DexMoveValue = DexMove.ValueType
+    DexPokemonValue = DexPokemon.ValueType
+    DexStatusValue = DexStatus.ValueType
+    DexTypeValue = DexType.ValueType
+else:
+    # The Dex ValueTypes are int NewTypes, so validate them as plain ints instead of importing the poketypes dex tables
+    DexAbilityValue = DexConditionValue = DexItemValue = DexMoveValue = DexPokemonValue = DexStatusValue = int
+    DexTypeValue = int
+
+# Sentinel used in place of None (an unknown stat) when storing StatBlocks in an int16 array
+UNKNOWN_STAT = -(2**15)
+
+
+# Dex values are non-negative protobuf enum ints, and pydantic-core already unboxes IntEnum inputs to plain ints.
+# Constraining them through Field metadata instead of a python validator keeps their validation inside pydantic-core
+DEX_VALUE = Field(ge=0)
+
+
+@lru_cache(maxsize=4096)
+def pokemon_id(player_id: str, species: DexPokemonValue, gender: Optional[str], nickname: Optional[str]) -> str:
+    """Build the string id used to key a pokemon in a BattleState team.
+
+    The same handful of pokemon are looked up on nearly every battle message, so the formatted ids are cached.
+
+    Args:
+        player_id (str): The id of the player controlling the pokemon
+        species (DexPokemonValue): The species (or base species) of the pokemon
+        gender (Optional[str]): The gender of the pokemon, if any
+        nickname (Optional[str]): The nickname of the pokemon, if known
+
+    Returns:
+        str: An id for this pokemon
+    """
+    return f"{player_id}_{species}_{gender}_{nickname}"
+
+
+@dataclass(**DATACLASS_OPTIONS)
+class StatBlock:
+    """Dataclass for representing the min-max stats of a pokemon.
 
     Note:
         If you know the exact stat of a pokemon, min=max.
 
+    Tip:
+        This is a plain (slotted, where supported) dataclass rather than a BaseModel, since it's a leaf value type with
+        nothing to validate beyond its field types. Pydantic still validates and serializes it as a field of
+        BattlePokemon.
+
     Attributes:
         min_attack: The minimum attack of the pokemon
         min_defence: The minimum defence of the pokemon
@@ -40,6 +86,8 @@ class StatBlock(BaseModel):
         max_hp: The maximum hp of the pokemon
     """
 
+    __pydantic_config__ = ConfigDict(extra="forbid")
+
     min_attack: Optional[int] = None
     min_defence: Optional[int] = None
     min_spattack: Optional[int] = None
@@ -54,9 +102,39 @@ class StatBlock(BaseModel):
     max_speed: Optional[int] = None
     max_hp: Optional[int] = None
 
+    def to_array(self) -> "np.ndarray":
+        """Pack the stat block into an int16 numpy array, in field order, for featurization.
+
+        Unknown (None) stats are stored as UNKNOWN_STAT.
+
+        Returns:
+            np.ndarray: A (12,) int16 array of the stats
+        """
+        np = require_numpy()
+        values = [getattr(self, field.name) for field in fields(self)]
+        return np.array([UNKNOWN_STAT if value is None else value for value in values], dtype=np.int16)
+
+    @classmethod
+    def from_array(cls, array: "np.ndarray") -> "StatBlock":
+        """Unpack a stat block from an array created by `to_array`.
+
+        Args:
+            array (np.ndarray): A (12,) int16 array of the stats, in field order.
+
+        Returns:
+            StatBlock: The unpacked stat block
+        """
+        return cls(
+            **{
+                field.name: None if value == UNKNOWN_STAT else value
+                for field, value in zip(fields(cls), array.tolist())
+            }
+        )
+
 
-class BoostBlock(BaseModel):
-    """BaseModel for representing the current stat boosts of a pokemon.
+@dataclass(**DATACLASS_OPTIONS)
+class BoostBlock:
+    """Dataclass for representing the current stat boosts of a pokemon.
 
     Attributes:
         attack: The current attack boost of the pokemon
@@ -68,6 +146,8 @@ class BoostBlock(BaseModel):
         evasion: The current evasion boost of the pokemon
     """
 
+    __pydantic_config__ = ConfigDict(extra="forbid")
+
     attack: int = 0
     defence: int = 0
     spattack: int = 0
@@ -77,8 +157,29 @@ class BoostBlock(BaseModel):
     accuracy: int = 0
     evasion: int = 0
 
+    def to_array(self) -> "np.ndarray":
+        """Pack the boosts into an int8 numpy array, in field order, for featurization.
+
+        Returns:
+            np.ndarray: A (7,) int8 array of the boosts
+        """
+        np = require_numpy()
+        return np.array([getattr(self, field.name) for field in fields(self)], dtype=np.int8)
+
+    @classmethod
+    def from_array(cls, array: "np.ndarray") -> "BoostBlock":
+        """Unpack the boosts from an array created by `to_array`.
 
-class BattleMove(BaseModel):
+        Args:
+            array (np.ndarray): A (7,) int8 array of the boosts, in field order.
+
+        Returns:
+            BoostBlock: The unpacked boosts
+        """
+        return cls(*array.tolist())
+
+
+class BattleMove(TrustedConstructMixin, BaseModel):
     """BaseModel for representing a move that a pokemon potentially has.
 
     Note:
@@ -87,18 +188,25 @@ class BattleMove(BaseModel):
         possible. Especially since we may be able to eliminate some moves as impossible, even if we still don't know
         which moves the pokemon has.
 
+    Tip:
+        Possible moves, abilities and items are frozen (and so hashable), so they can be shared between battle states
+        and deduplicated with sets. Use `model_copy(update=...)` to change one, e.g. to bump its use_count.
+
     Attributes:
         name: The move as a DexMove
         probability: The probability that this pokemon has this move.
     """
 
-    name: DexMove.ValueType = Field(..., description="The move")
+    # ignored_types only matters for the opt-in Cython build
+    model_config = ConfigDict(frozen=True, extra="forbid", ignored_types=FUNCTION_TYPES, defer_build=True)
+
+    name: Annotated[DexMoveValue, DEX_VALUE] = Field(..., description="The move")
     probability: float = Field(1.0, description="The probability that this pokemon has this move.")
 
     use_count: int = Field(..., description="The number of times this move has been seen")
 
 
-class BattleAbility(BaseModel):
+class BattleAbility(TrustedConstructMixin, BaseModel):
     """BaseModel for representing an ability that a pokemon potentially has.
 
     Note:
@@ -112,11 +220,14 @@ class BattleAbility(BaseModel):
         probability: The probability that this pokemon has this ability.
     """
 
-    name: DexAbility.ValueType = Field(..., description="The ability")
+    # ignored_types only matters for the opt-in Cython build
+    model_config = ConfigDict(frozen=True, extra="forbid", ignored_types=FUNCTION_TYPES, defer_build=True)
+
+    name: Annotated[DexAbilityValue, DEX_VALUE] = Field(..., description="The ability")
     probability: float = Field(1.0, description="The probability that this pokemon has this ability.")
 
 
-class BattleItem(BaseModel):
+class BattleItem(TrustedConstructMixin, BaseModel):
     """BaseModel for representing an item that a pokemon is potentially holding.
 
     Note:
@@ -129,17 +240,27 @@ class BattleItem(BaseModel):
         probability: The probability that this pokemon is holding this item.
     """
 
-    name: DexItem.ValueType = Field(..., description="The item")
+    # ignored_types only matters for the opt-in Cython build
+    model_config = ConfigDict(frozen=True, extra="forbid", ignored_types=FUNCTION_TYPES, defer_build=True)
+
+    name: Annotated[DexItemValue, DEX_VALUE] = Field(..., description="The item")
     probability: float = Field(1.0, description="The probability that this pokemon is holding this item.")
 
 
-class BattlePokemon(BaseModel):
-    """BaseModel for representing a pokemon in a battle.
+@pydantic_dataclass(config=ConfigDict(extra="forbid", defer_build=True), **DATACLASS_OPTIONS)
+class BattlePokemon(TrustedConstructMixin):
+    """Pydantic dataclass for representing a pokemon in a battle.
 
     Tip:
         In contrast to DexPokemon and PokedexPokemon from poketypes, this class is meant to represent a specific
         instance of a pokemon as it is in a battle.
 
+    Note:
+        This is a (slotted, where supported) pydantic dataclass rather than a BaseModel, since every BattleState keeps
+        its own copy of each pokemon, and a slotted instance takes a fraction of the memory of a BaseModel's __dict__.
+        It's validated and serialized the same way as a field of BattleState. To validate or dump one on its own, use
+        a `pydantic.TypeAdapter(BattlePokemon)`.
+
     Attributes:
         player_id: A unique identifier for the player that controls this pokemon
         species: The species of the pokemon
@@ -171,8 +292,8 @@ class BattlePokemon(BaseModel):
 
     player_id: str = Field(..., description="A unique identifier for the player that controls this pokemon")
 
-    species: DexPokemon.ValueType = Field(..., description="The species of the pokemon")
-    base_species: DexPokemon.ValueType = Field(..., description="The base species of the pokemon")
+    species: Annotated[DexPokemonValue, DEX_VALUE] = Field(..., description="The species of the pokemon")
+    base_species: Annotated[DexPokemonValue, DEX_VALUE] = Field(..., description="The base species of the pokemon")
     nickname: Optional[str] = Field(
         None,
         description="The nickname of this pokemon. If we don't know the nickname yet, put None",
@@ -200,34 +321,42 @@ class BattlePokemon(BaseModel):
     active: bool = Field(False, description="Whether the current pokemon is active or not")
 
     stats: StatBlock = Field(
-        StatBlock(),
+        default_factory=StatBlock,
         description="The min-max stat block of the pokemon. If you know the exact stats, min=max",
     )
-    boosts: BoostBlock = Field(StatBlock(), description="The current stat boosts of the pokemon.")
+    boosts: BoostBlock = Field(default_factory=BoostBlock, description="The current stat boosts of the pokemon.")
 
     has_item: Optional[bool] = Field(
         None,
         description="Whether the pokemon is holding an item or not. None if unknown",
     )
-    possible_items: List[BattleItem] = Field([], description="The list of possible items that the pokemon is holding")
+    possible_items: List[BattleItem] = Field(
+        default_factory=list, description="The list of possible items that the pokemon is holding"
+    )
 
-    possible_abilities: List[BattleAbility] = Field([], description="The list of possible abilities of this pokemon")
-    overwritten_ability: Optional[DexAbility.ValueType] = Field(
+    possible_abilities: List[BattleAbility] = Field(
+        default_factory=list, description="The list of possible abilities of this pokemon"
+    )
+    overwritten_ability: Optional[Annotated[DexAbilityValue, DEX_VALUE]] = Field(
         None,
         description="If this pokemon's ability has been overwritten, which ability does it now have?",
     )
 
     moveset: List[BattleMove] = Field(
-        [],
+        default_factory=list,
         description="The list of moves this pokemon has. If doing things probablistically, this can exceed 4!",
     )
 
-    status: Optional[DexStatus.ValueType] = Field(None, description="The current status this pokemon is dealing with")
-    conditions: List[DexCondition.ValueType] = Field(
-        [], description="The list of current conditions this pokemon is dealing with"
+    status: Optional[Annotated[DexStatusValue, DEX_VALUE]] = Field(
+        None, description="The current status this pokemon is dealing with"
+    )
+    conditions: List[Annotated[DexConditionValue, DEX_VALUE]] = Field(
+        default_factory=list, description="The list of current conditions this pokemon is dealing with"
     )
 
-    tera_type: Optional[DexType.ValueType] = Field(None, description="The teratype of this pokemon")
+    tera_type: Optional[Annotated[DexTypeValue, DEX_VALUE]] = Field(
+        None, description="The teratype of this pokemon"
+    )
 
     is_tera: bool = Field(False, description="Whether the pokemon is currently teratyped")
     is_mega: bool = Field(False, description="Whether the pokemon is currently mega-evolved")
@@ -243,9 +372,7 @@ class BattlePokemon(BaseModel):
         Returns:
             str: An id for this pokemon
         """
-        id_str = f"{self.player_id}_{self.species}_{self.gender}_{self.nickname}"
-
-        return id_str
+        return pokemon_id(self.player_id, self.species, self.gender, self.nickname)
 
     def to_base_id(self) -> str:
         """Extract an id for this pokemon based on currently known base-level information.
@@ -255,6 +382,4 @@ class BattlePokemon(BaseModel):
         Returns:
             str: An id for this pokemon
         """
-        id_str = f"{self.player_id}_{self.base_species}_{self.gender}_{self.nickname}"
-
-        return id_str
+        return pokemon_id(self.player_id, self.base_species, self.gender, self.nickname)
@@ -11,16 +11,45 @@ Tip:
     things like player names, victory information, administrative data should be stored in the Battle class.
 """
 
+from enum import IntFlag
+from typing import TYPE_CHECKING, Annotated
+
 from beartype.typing import Dict, Optional
 
-from poketypes.dex import DexWeather
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from ._compat import FUNCTION_TYPES
 from .choices import BattleChoice
-from .pokemon import BattlePokemon
+from .pokemon import DEX_VALUE, BattlePokemon
+from .trusted import TrustedConstructMixin
+
+if TYPE_CHECKING:
+    from poketypes.dex import DexWeather
+
+    DexWeatherValue = DexWeather.ValueType
+else:
+    # DexWeather.ValueType is an int NewType, so validate it as a plain int instead of importing the poketypes dex
+    # tables
+    DexWeatherValue = int
+
+
+class BattleFlags(IntFlag):
+    """The once-per-battle mechanics each side has used, packed into a single int.
+
+    Each flag corresponds to the BattleState bool field of the same name, e.g. PLAYER_HAS_MEGAD to player_has_megad.
+    """
+
+    PLAYER_HAS_MEGAD = 1
+    OPPONENT_HAS_MEGAD = 2
+    PLAYER_HAS_ZMOVED = 4
+    OPPONENT_HAS_ZMOVED = 8
+    PLAYER_HAS_DYNAMAXED = 16
+    OPPONENT_HAS_DYNAMAXED = 32
+    PLAYER_HAS_TERATYPED = 64
+    OPPONENT_HAS_TERATYPED = 128
 
 
-class BattleState(BaseModel):
+class BattleState(TrustedConstructMixin, BaseModel):
     """A full representation of a pokemon battle state as a serializable object.
 
     Built to support singles, doubles, or triples gametypes
@@ -35,25 +64,30 @@ class BattleState(BaseModel):
         battle_choice: The choices the player can make in response to this battle state
     """
 
+    # ignored_types only matters for the opt-in Cython build
+    model_config = ConfigDict(extra="forbid", ignored_types=FUNCTION_TYPES, defer_build=True)
+
     turn: int = Field(
         ...,
         description="The turn number of this battle state.",
     )
 
     player_team: Dict[str, BattlePokemon] = Field(
-        {},
+        default_factory=dict,
         description="A list containing Pokemon on the player's team. The keys must be unique to this pokemon",
     )
     opponent_team: Dict[str, BattlePokemon] = Field(
-        {},
+        default_factory=dict,
         description="A list containing Pokemon on the opponent's team.",
     )
 
     player_slots: Dict[int, Optional[str]] = Field(
-        {}, description="Maps the player'ss battle slots to either None or the string id of the pokemon in that slot"
+        default_factory=dict,
+        description="Maps the player'ss battle slots to either None or the string id of the pokemon in that slot",
     )
     opponent_slots: Dict[int, Optional[str]] = Field(
-        {}, description="Maps the opponent's battle slots to either None or the string id of the pokemon in that slot"
+        default_factory=dict,
+        description="Maps the opponent's battle slots to either None or the string id of the pokemon in that slot",
     )
 
     player_has_megad: bool = Field(False, description="Whether the player has mega evolved a pokemon")
@@ -68,8 +102,37 @@ class BattleState(BaseModel):
     player_has_teratyped: bool = Field(False, description="Whether the player has teratyped a pokemon")
     opponent_has_teratyped: bool = Field(False, description="Whether the opponent has teratyped a pokemon")
 
-    weather: Optional[DexWeather.ValueType] = Field(None, description="The current weather in the field")
+    weather: Optional[Annotated[DexWeatherValue, DEX_VALUE]] = Field(
+        None, description="The current weather in the field"
+    )
 
     battle_choice: Optional[BattleChoice] = Field(
         None, description="The choices the player can make in response to this battle state"
     )
+
+    @property
+    def flags(self) -> BattleFlags:
+        """Pack the player_has_* and opponent_has_* fields into a BattleFlags bitmask.
+
+        This is handy as a single feature for a model, or for comparing the used mechanics of two states at once.
+
+        Returns:
+            BattleFlags: The flags for every mechanic that has been used
+        """
+        flags = BattleFlags(0)
+        for flag in BattleFlags:
+            if getattr(self, flag.name.lower()):
+                flags |= flag
+        return flags
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the battle state to compact UTF-8 encoded JSON, for writing snapshots to disk or a socket.
+
+        Like `Battle.to_json_bytes`, fields that are None are left out, and the output comes straight from the
+        pydantic-core serializer without being decoded into a python string. Load it back with `model_validate_json`,
+        which parses the bytes directly as well.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON representation of this battle state
+        """
+        return self.__pydantic_serializer__.to_json(self, exclude_none=True)
@@ -0,0 +1,188 @@
+"""Mixin for rebuilding battle models from data that has already been validated.
+
+Battles are frequently reloaded from sources that were validated when they were first created, such as saved battle
+dumps, cached replays, or stored training data. Running the full pydantic validation over every nested BattleState for
+these is wasted work, so this module provides a way to construct the models directly, skipping validation entirely.
+
+Warning:
+    Only use `from_trusted` on data that was produced by `model_dump()` (python mode) on these same models. Nothing
+    is validated, so malformed data will produce malformed models instead of raising an error. The containers in the
+    given data are reused where possible, so don't reuse that data for anything else afterwards.
+"""
+
+from dataclasses import is_dataclass
+from functools import lru_cache
+from typing import Annotated, Any, Callable, Dict, Optional, Tuple, Type, TypeVar, Union, get_args, get_origin
+
+from pydantic import TypeAdapter
+from pydantic.fields import FieldInfo
+
+TrustedModel = TypeVar("TrustedModel", bound="TrustedConstructMixin")
+Builder = Callable[[Any], Any]
+
+
+class TrustedConstructMixin:
+    """Mixin that adds `from_trusted` to a pydantic BaseModel or dataclass, for building it without validation.
+
+    Tip:
+        Put this mixin before BaseModel in the class bases, e.g. `class Battle(TrustedConstructMixin, BaseModel)`.
+        Subclasses of a model using this mixin inherit `from_trusted` automatically.
+    """
+
+    # Keep slotted pydantic dataclasses using this mixin free of a per-instance __dict__
+    __slots__ = ()
+
+    @classmethod
+    def from_trusted(cls: Type[TrustedModel], data: Dict[str, Any]) -> TrustedModel:
+        """Build an instance of this model from already-validated data, without running validation.
+
+        Nested models that also use this mixin are built the same way. For BaseModels, the fields present in `data`
+        are recorded as the set fields, so `exclude_unset` serialization behaves the same as it would for a validated
+        model. Pydantic dataclasses don't track set fields, so they just have their fields assigned.
+
+        Args:
+            data (Dict[str, Any]): The python-mode `model_dump()` of a previously validated model.
+
+        Returns:
+            TrustedModel: The constructed model.
+        """
+        values = {}
+        fields_set = set()
+        for name, builder, field in _field_builders(cls):
+            if name in data:
+                value = data[name]
+                values[name] = value if builder is None else builder(value)
+                fields_set.add(name)
+            else:
+                values[name] = field.get_default(call_default_factory=True)
+
+        model = cls.__new__(cls)
+        if is_dataclass(cls):
+            for name, value in values.items():
+                object.__setattr__(model, name, value)
+            return model
+
+        # This is what model_construct does internally, minus its per-call handling of aliases and extras, which none
+        # of these models use. It's the hot path when reloading a battle, so the overhead adds up quickly.
+        object.__setattr__(model, "__dict__", values)
+        object.__setattr__(model, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(model, "__pydantic_extra__", None)
+        object.__setattr__(model, "__pydantic_private__", None)
+        return model
+
+
+@lru_cache(maxsize=None)
+def _field_builders(model: type) -> Tuple[Tuple[str, Optional[Builder], FieldInfo], ...]:
+    """Work out, once per model class, how each field's value needs to be built.
+
+    Args:
+        model (type): The model or pydantic dataclass using TrustedConstructMixin.
+
+    Returns:
+        Tuple[Tuple[str, Optional[Builder], FieldInfo], ...]: The name, builder and info of each field. A builder of
+            None means the value can be used exactly as given.
+    """
+    fields = model.__pydantic_fields__ if is_dataclass(model) else model.model_fields
+    return tuple((name, _builder_for(field.annotation), field) for name, field in fields.items())
+
+
+def _builder_for(annotation: Any) -> Optional[Builder]:
+    """Create a function that builds values of the given annotation from already-validated data.
+
+    Models using TrustedConstructMixin and dataclasses are constructed directly, and lists/tuples/dicts of them are
+    walked recursively. Unions tagged with a discriminator are resolved by their tag, and any other union that can't be
+    resolved to a single model is validated normally, since its members can't be told apart otherwise.
+
+    Args:
+        annotation (Any): The type annotation of the field.
+
+    Returns:
+        Optional[Builder]: The builder for this annotation, or None if values can be used as-is.
+    """
+    origin = get_origin(annotation)
+
+    if origin is None:
+        build = _constructor_for(annotation)
+        if build is None:
+            return None
+        return lambda value: build(value) if isinstance(value, dict) else value
+    if origin is Annotated:
+        inner, *metadata = get_args(annotation)
+        discriminator = next((m.discriminator for m in metadata if isinstance(m, FieldInfo) and m.discriminator), None)
+        members = get_args(inner) if get_origin(inner) is Union else ()
+        constructors = [_constructor_for(member) for member in members]
+        if isinstance(discriminator, str) and members and None not in constructors:
+            tagged = {_tag_of(member, discriminator): build for member, build in zip(members, constructors)}
+            return lambda value: tagged[value[discriminator]](value) if isinstance(value, dict) else value
+        return _builder_for(inner)
+    if origin is Union:
+        members = [member for member in get_args(annotation) if member is not type(None)]
+        if len(members) == 1:
+            return _builder_for(members[0])
+        builders = [_builder_for(member) for member in members]
+        if all(builder is None for builder in builders):
+            return None
+
+        # A list member and a single (possibly tagged) model member can be told apart by the shape of the data alone
+        list_builders = [builder for member, builder in zip(members, builders) if get_origin(member) is list]
+        other_builders = [builder for member, builder in zip(members, builders) if get_origin(member) is not list]
+        if len(list_builders) == 1 and len(other_builders) == 1 and other_builders[0] is not None:
+            list_builder, other_builder = list_builders[0] or (lambda value: value), other_builders[0]
+            return lambda value: list_builder(value) if isinstance(value, list) else other_builder(value)
+
+        adapter = TypeAdapter(annotation)
+        return lambda value: adapter.validate_python(value) if isinstance(value, dict) else value
+    if origin is list:
+        item_builder = _builder_for(get_args(annotation)[0])
+        if item_builder is None:
+            return None
+        return lambda value: value if value is None else [item_builder(item) for item in value]
+    if origin is tuple:
+        args = get_args(annotation)
+        item_builder = _builder_for(args[0]) if len(args) == 2 and args[1] is Ellipsis else None
+        if item_builder is None:
+            return None
+        return lambda value: value if value is None else tuple(item_builder(item) for item in value)
+    if origin is dict:
+        item_builder = _builder_for(get_args(annotation)[1])
+        if item_builder is None:
+            return None
+        return lambda value: value if value is None else {key: item_builder(item) for key, item in value.items()}
+
+    return None
+
+
+def _constructor_for(annotation: Any) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    """Find the function that constructs an instance of the given class from its dumped data, if it has one.
+
+    Models using TrustedConstructMixin use `from_trusted`, and dataclasses are passed their fields directly, since
+    their plain `__init__` doesn't validate anything anyway.
+
+    Args:
+        annotation (Any): The type annotation to construct.
+
+    Returns:
+        Optional[Callable[[Dict[str, Any]], Any]]: The constructor, or None if this isn't a class we can construct.
+    """
+    if not isinstance(annotation, type):
+        return None
+    if issubclass(annotation, TrustedConstructMixin):
+        return annotation.from_trusted
+    if is_dataclass(annotation):
+        return lambda value: annotation(**value)
+    return None
+
+
+def _tag_of(member: type, discriminator: str) -> Any:
+    """Get the constant discriminator tag of a tagged union member.
+
+    Args:
+        member (type): A pydantic model or dataclass that is a member of a tagged union.
+        discriminator (str): The name of the tag field.
+
+    Returns:
+        Any: The default (and only) value of the tag field.
+    """
+    if is_dataclass(member):
+        return member.__dataclass_fields__[discriminator].default
+    return member.model_fields[discriminator].default
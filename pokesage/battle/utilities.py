@@ -1,7 +1,35 @@
 """Contains utility functions for the battle module."""
 
+from functools import lru_cache
 from poketypes.dex import DexMoveTarget
-from typing import List, Literal, Dict, Optional
+from typing import TYPE_CHECKING, FrozenSet, List, Literal, Dict, Optional
+
+from .columns import require_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# The order of the slot axis in batched targeting masks: your side from -3 to -1, then the opponent's from 1 to 3
+TARGET_SLOTS = (-3, -2, -1, 1, 2, 3)
+
+# Whether a move with each DexMoveTarget needs a target slot picked for it
+_NEEDS_TARGET: Dict[DexMoveTarget.ValueType, bool] = {
+    DexMoveTarget.MOVETARGET_SELF: False,
+    DexMoveTarget.MOVETARGET_ADJACENTALLY: True,
+    DexMoveTarget.MOVETARGET_ADJACENTALLYORSELF: True,
+    DexMoveTarget.MOVETARGET_ALL: False,
+    DexMoveTarget.MOVETARGET_ALLADJACENT: False,
+    DexMoveTarget.MOVETARGET_ALLADJACENTFOES: False,
+    DexMoveTarget.MOVETARGET_ALLIES: False,
+    DexMoveTarget.MOVETARGET_ALLYSIDE: False,
+    DexMoveTarget.MOVETARGET_ALLYTEAM: False,
+    DexMoveTarget.MOVETARGET_ANY: True,
+    DexMoveTarget.MOVETARGET_FOESIDE: False,
+    DexMoveTarget.MOVETARGET_NORMAL: True,
+    DexMoveTarget.MOVETARGET_RANDOMNORMAL: False,
+    DexMoveTarget.MOVETARGET_SCRIPTED: False,  # TODO: Need to verify what this is
+    DexMoveTarget.MOVETARGET_ADJACENTFOE: True,
+}
 
 
 def get_valid_target_slots(
@@ -41,13 +69,91 @@ def get_valid_target_slots(
     Returns:
         List[int]: A list of valid target slots. Will be a subset of filled_slots.
     """
-    targettable_slots: List[int] = []
+    targettable_slots = _targettable_slots(source_slot, move_target, gametype)
 
-    for target_slot in filled_slots:
-        if can_target_slot(source_slot, target_slot, move_target, gametype):
-            targettable_slots.append(target_slot)
+    return [target_slot for target_slot in filled_slots if target_slot in targettable_slots]
 
-    return targettable_slots
+
+@lru_cache(maxsize=None)
+def _targettable_slots(
+    source_slot: int, move_target: DexMoveTarget.ValueType, gametype: Literal["doubles", "triples"]
+) -> FrozenSet[int]:
+    """Find every slot that source_slot can target with move_target, once per combination.
+
+    There are only a few dozen combinations of source slot, targeting move target and gametype, so caching these
+    turns get_valid_target_slots into a lookup and a filter.
+
+    Args:
+        source_slot (int): The integer slot of the pokemon using the move.
+        move_target (DexMoveTarget.ValueType): The DexMoveTarget of the move being used.
+        gametype (Literal["doubles", "triples"]): The gametype of the battle. Either "doubles" or "triples".
+
+    Returns:
+        FrozenSet[int]: The slots, on either side of the field, that can be targeted.
+    """
+    if not needs_target(move_target):
+        return frozenset()
+
+    return frozenset(
+        target_slot
+        for target_slot in TARGET_SLOTS
+        if can_target_slot(source_slot, target_slot, move_target, gametype)
+    )
+
+
+def get_valid_target_slots_batch(
+    source_slots: "np.ndarray",
+    filled_mask: "np.ndarray",
+    move_target: DexMoveTarget.ValueType,
+    gametype: Literal["doubles", "triples"],
+) -> "np.ndarray":
+    """Get the valid target slots of a move for many source slots at once, as a boolean mask.
+
+    This is the vectorized form of get_valid_target_slots, for searching over many positions or battles at once. The
+    slot axis of the masks follows TARGET_SLOTS, so `TARGET_SLOTS[i]` is the slot of column i.
+
+    Args:
+        source_slots (np.ndarray): A (n,) integer array of the slots of the pokemon using the move.
+        filled_mask (np.ndarray): A (n, 6) or (6,) boolean array of which slots are filled, in TARGET_SLOTS order.
+        move_target (DexMoveTarget.ValueType): The DexMoveTarget of the move being used.
+        gametype (Literal["doubles", "triples"]): The gametype of the battle. Either "doubles" or "triples".
+
+    Raises:
+        ImportError: If numpy is not installed.
+
+    Returns:
+        np.ndarray: A (n, 6) boolean array of which filled slots each source slot can target.
+    """
+    np = require_numpy()
+
+    source_slots = np.asarray(source_slots)
+    source_index = np.where(source_slots < 0, source_slots + 3, source_slots + 2)
+
+    return _target_mask_table(move_target, gametype)[source_index] & np.asarray(filled_mask, dtype=np.bool_)
+
+
+@lru_cache(maxsize=None)
+def _target_mask_table(move_target: DexMoveTarget.ValueType, gametype: Literal["doubles", "triples"]) -> "np.ndarray":
+    """Build the (source slot, target slot) boolean table of a move target, once per move target and gametype.
+
+    Args:
+        move_target (DexMoveTarget.ValueType): The DexMoveTarget of the move being used.
+        gametype (Literal["doubles", "triples"]): The gametype of the battle. Either "doubles" or "triples".
+
+    Returns:
+        np.ndarray: A read-only (6, 6) boolean array, with both axes in TARGET_SLOTS order.
+    """
+    np = require_numpy()
+
+    table = np.array(
+        [
+            [target_slot in _targettable_slots(source_slot, move_target, gametype) for target_slot in TARGET_SLOTS]
+            for source_slot in TARGET_SLOTS
+        ],
+        dtype=np.bool_,
+    )
+    table.flags.writeable = False
+    return table
 
 
 def needs_target(move_target: Optional[DexMoveTarget.ValueType]) -> bool:
@@ -62,25 +168,7 @@ def needs_target(move_target: Optional[DexMoveTarget.ValueType]) -> bool:
     if move_target is None:
         return False
 
-    need_dict: Dict[DexMoveTarget.ValueType, bool] = {
-        DexMoveTarget.MOVETARGET_SELF: False,
-        DexMoveTarget.MOVETARGET_ADJACENTALLY: True,
-        DexMoveTarget.MOVETARGET_ADJACENTALLYORSELF: True,
-        DexMoveTarget.MOVETARGET_ALL: False,
-        DexMoveTarget.MOVETARGET_ALLADJACENT: False,
-        DexMoveTarget.MOVETARGET_ALLADJACENTFOES: False,
-        DexMoveTarget.MOVETARGET_ALLIES: False,
-        DexMoveTarget.MOVETARGET_ALLYSIDE: False,
-        DexMoveTarget.MOVETARGET_ALLYTEAM: False,
-        DexMoveTarget.MOVETARGET_ANY: True,
-        DexMoveTarget.MOVETARGET_FOESIDE: False,
-        DexMoveTarget.MOVETARGET_NORMAL: True,
-        DexMoveTarget.MOVETARGET_RANDOMNORMAL: False,
-        DexMoveTarget.MOVETARGET_SCRIPTED: False,  # TODO: Need to verify what this is
-        DexMoveTarget.MOVETARGET_ADJACENTFOE: True,
-    }
-
-    return need_dict[move_target]
+    return _NEEDS_TARGET[move_target]
 
 
 def can_target_slot(
@@ -3,7 +3,7 @@
 Classes:
     Connector: Abstract Connector class for other connector classes to implement with their connection functions.
     WebsocketConnector: Connector class for connecting to a websocket server.
-    ConnectionTerminationCode: Enum for the possible connection termination codes.
+    ConnectionTerminationCode: IntEnum for the possible connection termination codes.
     ConnectionTermination: Class for storing a connection termination code and message.
 """
 
@@ -1,20 +1,21 @@
 """Abstract Connector class for using any backend."""
 
 from abc import ABC, abstractmethod
-from enum import Enum, unique
-from beartype.typing import AsyncGenerator, Optional, Tuple, Union
+from dataclasses import dataclass
+from enum import IntEnum, unique
+from typing import AsyncGenerator, Optional, Tuple, Union
 
 from aiohttp import ClientSession
-from pydantic import BaseModel, Field
 
+from ..battle._compat import DATACLASS_OPTIONS
 from ..battle.choices import AnyChoice
 from ..battle.state import BattleState
 from ..processors import ProgressState
 
 
 @unique
-class ConnectionTerminationCode(Enum):
-    """Enum for the possible termination codes for a connection."""
+class ConnectionTerminationCode(IntEnum):
+    """IntEnum for the possible termination codes for a connection."""
 
     OBJECTIVE_COMPLETE = 0
     INVALID_CHOICE = 1
@@ -24,16 +25,17 @@ class ConnectionTerminationCode(Enum):
     OTHER_ERROR = 5
 
 
-class ConnectionTermination(BaseModel):
-    """BaseModel for a connection termination.
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
+class ConnectionTermination:
+    """Dataclass for a connection termination.
 
     Attributes:
         code: The status code for this termination
         message: An optional extra string message about this termination
     """
 
-    code: ConnectionTerminationCode = Field(..., description="The status code for this termination")
-    message: Optional[str] = Field(None, description="An optional extra string message about this termination")
+    code: ConnectionTerminationCode
+    message: Optional[str] = None
 
 
 class Connector(ABC):
@@ -1,26 +1,72 @@
 """Connector class for using the Showdown Websocket Simulator as a backend."""
 
+import asyncio
 import json
 import os
-from beartype.typing import AsyncGenerator, Dict, List, Literal, Optional, Tuple, Type, Union
+from beartype.typing import AsyncGenerator, Dict, List, Literal, Optional, Set, Tuple, Type, Union
+from typing import Annotated, Any, get_args, get_origin
 from urllib.parse import quote
 
 from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType
 from poketypes.showdown.showdownmessage import (
     Message,
     Message_challstr,
-    MType,
+    Message_formats,
     Message_updatesearch,
+    Message_updateuser,
+    MType,
 )
 from yarl import URL
-from beartype.door import is_bearable
 
-from ..battle.battle import Battle
+from ..battle.battle import Battle, Gametype
 from ..battle.choices import AnyChoice, ForceSwitchChoice, MoveDecisionChoice, QuitChoice, ResignChoice, TeamOrderChoice
 from ..battle.state import BattleState
 from ..processors import ShowdownProcessor
 from .abstractconnector import ConnectionTermination, ConnectionTerminationCode, Connector, ProgressState
 
+# Deletes the brackets and spaces from a lowercased format name, turning it into its format id
+_FORMAT_ID_TABLE = str.maketrans("", "", "[] ")
+
+
+def _choice_types(choice_alias: Any) -> Tuple[type, ...]:
+    """Flatten a choice type alias into the tuple of runtime classes it allows, for use with isinstance.
+
+    Annotated metadata is dropped, Unions are flattened, None becomes NoneType, and parametrized lists become list.
+    This means list contents aren't checked, only that the action is a list.
+
+    Args:
+        choice_alias (Any): One of the choice type aliases (or choice classes) in pokesage.battle.choices.
+
+    Returns:
+        Tuple[type, ...]: The classes an action of that alias can be an instance of.
+    """
+    if choice_alias is None:
+        return (type(None),)
+
+    origin = get_origin(choice_alias)
+    if origin is Annotated:
+        return _choice_types(get_args(choice_alias)[0])
+    elif origin is Union:
+        return tuple(t for arg in get_args(choice_alias) for t in _choice_types(arg))
+    elif origin is not None:
+        return (origin,)
+
+    return (choice_alias,)
+
+
+# The choice type aliases resolved to isinstance-ready tuples once, since submit_action checks one per decision
+_ANY_CHOICE_TYPES = _choice_types(AnyChoice)
+_TEAM_ORDER_CHOICE_TYPES = _choice_types(TeamOrderChoice)
+_FORCE_SWITCH_CHOICE_TYPES = _choice_types(ForceSwitchChoice)
+_MOVE_DECISION_CHOICE_TYPES = _choice_types(MoveDecisionChoice)
+
+# The name and choice types submit_action expects for each progress state that asks the player for a decision
+_SUBMIT_CHOICE_TYPES: Dict[ProgressState, Tuple[str, Tuple[type, ...]]] = {
+    ProgressState.TEAM_ORDER: ("TeamOrderChoice", _TEAM_ORDER_CHOICE_TYPES),
+    ProgressState.SWITCH: ("ForceSwitchChoice", _FORCE_SWITCH_CHOICE_TYPES),
+    ProgressState.MOVE: ("MoveDecisionChoice", _MOVE_DECISION_CHOICE_TYPES),
+}
+
 
 class WebsocketConnector(Connector):
     """Connector class for using the Showdown Websocket Simulator as a backend.
@@ -52,6 +98,7 @@ class WebsocketConnector(Connector):
         showdown_password: The password to use for logging in to showdown
         target_format: The format to use for this connection
         gametype: The gametype to use for this connection
+        slot_length: The number of battle slots per side for the gametype, i.e. the length of a list of choices.
         objective: The objective to use for this connection
         whitelist_users: A list of users to challenge if the objective is challenge.
         max_concurrent_battles: The maximum number of concurrent battles to have at once.
@@ -68,9 +115,11 @@ class WebsocketConnector(Connector):
         completed_battles: A dictionary of completed battles we have finished, mapping the battle id to the battle.
         pending_battle_amt: The number of battles we have pending.
         active_battle_amt: The number of battles we have active.
+        log_dirs_made: The formats whose logs directory has already been created by this connector.
 
     Raises:
         RuntimeError: If the objective is set to challenge but no users are in the whitelist.
+        RuntimeError: If the gametype is not one PokeSage supports.
     """
 
     def __init__(
@@ -92,6 +141,7 @@ class WebsocketConnector(Connector):
         self.showdown_password = showdown_password
         self.target_format = target_format
         self.gametype = gametype
+        self.slot_length = int(Gametype.from_showdown(gametype))
         self.objective = objective
 
         if self.objective == "challenge" and len(whitelist_users) == 0:
@@ -116,6 +166,17 @@ class WebsocketConnector(Connector):
 
         self.pending_battle_amt: int = 0
         self.active_battle_amt: int = 0
+        self.log_dirs_made: Set[str] = set()
+
+        # Handlers for the general message types we act on, looked up by the raw MType string in handle_general_message
+        self._general_handlers = {
+            MType.updateuser.value: self._on_updateuser,
+            MType.updatesearch.value: self._on_updatesearch,
+            MType.formats.value: self._on_formats,
+            MType.challstr.value: self._on_challstr,
+            # For whatever reason showdown seems to use pms for challenge requests, so pm should get a handler here
+            # once we check for any pending challenges we've sent/received. Until then pms are skipped unparsed
+        }
 
     async def launch_connection(
         self, session: ClientSession
@@ -144,12 +205,14 @@ class WebsocketConnector(Connector):
             async for msg in ws:
                 if msg.type == WSMsgType.TEXT:
                     message: str = msg.data
+                    first = message[0]
 
-                    if message[0] == ">" and "battle" in message:
-                        # In this case this is a battle message block
-                        battle_id = message.strip().split("\n")[0][1:]
+                    if message.startswith(">battle"):
+                        # In this case this is a battle message block, since battle room ids start with "battle"
+                        lines = message.rstrip().split("\n")
+                        battle_id = lines[0][1:]
 
-                        for m in message.strip().split("\n")[1:]:
+                        for m in lines[1:]:
                             progress_state, data = await self.handle_battle_message(session, ws, battle_id, m)
 
                             if data is None:
@@ -159,9 +222,9 @@ class WebsocketConnector(Connector):
                             conn_term = await self.process_action(ws, progress_state, action, battle_id)
                             if conn_term is not None:
                                 break
-                    elif message[0] == "|":
+                    elif first == "|":
                         # In this case this is a standard message block
-                        for m in message.strip().split("\n"):
+                        for m in message.rstrip().split("\n"):
                             (
                                 progress_state,
                                 conn_term,
@@ -169,20 +232,25 @@ class WebsocketConnector(Connector):
                             if conn_term is not None:
                                 break
 
+                            if progress_state == ProgressState.NO_ACTION:
+                                # Nothing to decide, so don't round-trip through the sage
+                                continue
+
                             action = yield progress_state, None
                             conn_term = await self.process_action(ws, progress_state, action)
                             if conn_term is not None:
                                 break
-                    elif message[0] != ">":
+                    elif first != ">":
                         # In this case this is a global message block
                         progress_state, conn_term = await self.handle_general_message(session, ws, f"||{message}")
                         if conn_term is not None:
                             break
 
-                        action = yield progress_state, None
-                        conn_term = await self.process_action(ws, progress_state, action)
-                        if conn_term is not None:
-                            break
+                        if progress_state != ProgressState.NO_ACTION:
+                            action = yield progress_state, None
+                            conn_term = await self.process_action(ws, progress_state, action)
+                            if conn_term is not None:
+                                break
                     else:
                         continue
 
@@ -216,47 +284,99 @@ class WebsocketConnector(Connector):
                 * ProgressState: The current progress state of the connection
                 * Optional[ConnectionTermination]: Any connection termination information, if needed
         """
-        msg = Message.from_message(message)
-
-        if msg.MTYPE == MType.updateuser:
-            self.logged_in = msg.NAMED
-
-            if self.logged_in and self.last_search is not None:
-                conn_term = await self.handle_updatesearch(session, ws, self.last_search)
-                if conn_term is not None:
-                    return ProgressState.FULL_END, conn_term
-        elif msg.MTYPE == MType.updatesearch:
-            if self.objective == "ladder":
-                self.pending_battle_amt = len(msg.SEARCHING)
-            self.active_battle_amt = 0 if msg.GAMES is None else len(msg.GAMES)
-
-            if self.logged_in:
-                conn_term = await self.handle_updatesearch(session, ws, msg)
-                if conn_term is not None:
-                    return ProgressState.FULL_END, conn_term
-            else:
-                self.last_search = msg
-        elif msg.MTYPE == MType.formats:
-            self.valid_formats = [f.lower().replace("[", "").replace("]", "").replace(" ", "") for f in msg.FORMATS]
-        elif msg.MTYPE == MType.challstr:
-            try:
-                await self.send_login(session, ws, msg)
-            except Exception as ex:
-                return ProgressState.FULL_END, ConnectionTermination(
-                    code=ConnectionTerminationCode.SETUP_ERROR, message=str(ex)
-                )
-        elif msg.MTYPE == MType.pm:
-            # For whatever reason showdown seems to use pms for challenge requests, so we
-            # need to check this for any pending challenges we've sent/received
-            pass
-        else:
-            # This is unlikely to be a bug since we only care about battle-related things in this class
-            # However, for debugging purposes it might be nice to log unexpected messages, or to expand the
-            # elif chain to include more types and manually pass so that it is clear they are unneeded
-            pass
+        # Look the handler up by the raw message type first, so that messages we don't act on are never parsed
+        # A missing handler is unlikely to be a bug since we only care about battle-related things in this class
+        # However, for debugging purposes it might be nice to log unexpected messages. Only add handlers for types we
+        # act on, since each handled message costs a full parse
+        handler = self._general_handlers.get(message.split("|", 2)[1])
+        if handler is None:
+            return ProgressState.NO_ACTION, None
+
+        conn_term = await handler(session, ws, Message.from_message(message))
+        if conn_term is not None:
+            return ProgressState.FULL_END, conn_term
 
         return ProgressState.NO_ACTION, None
 
+    async def _on_updateuser(
+        self, session: ClientSession, ws: ClientWebSocketResponse, message: Message_updateuser
+    ) -> Optional[ConnectionTermination]:
+        """Track whether we're logged in, and run any updatesearch that arrived before we were.
+
+        Args:
+            session (ClientSession): An aiohttp session to use for making requests as needed.
+            ws (ClientWebSocketResponse): The websocket connection to showdown.
+            message (Message_updateuser): The updateuser message to handle.
+
+        Returns:
+            Optional[ConnectionTermination]: Any connection termination information, if needed
+        """
+        self.logged_in = message.NAMED
+
+        if self.logged_in and self.last_search is not None:
+            return await self.handle_updatesearch(session, ws, self.last_search)
+
+        return None
+
+    async def _on_updatesearch(
+        self, session: ClientSession, ws: ClientWebSocketResponse, message: Message_updatesearch
+    ) -> Optional[ConnectionTermination]:
+        """Update the battle counts, then handle the search once we're logged in.
+
+        Args:
+            session (ClientSession): An aiohttp session to use for making requests as needed.
+            ws (ClientWebSocketResponse): The websocket connection to showdown.
+            message (Message_updatesearch): The updatesearch message to handle.
+
+        Returns:
+            Optional[ConnectionTermination]: Any connection termination information, if needed
+        """
+        if self.objective == "ladder":
+            self.pending_battle_amt = len(message.SEARCHING)
+        self.active_battle_amt = 0 if message.GAMES is None else len(message.GAMES)
+
+        if self.logged_in:
+            return await self.handle_updatesearch(session, ws, message)
+
+        self.last_search = message
+        return None
+
+    async def _on_formats(
+        self, session: ClientSession, ws: ClientWebSocketResponse, message: Message_formats
+    ) -> Optional[ConnectionTermination]:
+        """Store the formats the server supports, normalized to format ids.
+
+        Args:
+            session (ClientSession): An aiohttp session to use for making requests as needed.
+            ws (ClientWebSocketResponse): The websocket connection to showdown.
+            message (Message_formats): The formats message to handle.
+
+        Returns:
+            Optional[ConnectionTermination]: Any connection termination information, if needed
+        """
+        self.valid_formats = [f.lower().translate(_FORMAT_ID_TABLE) for f in message.FORMATS]
+        return None
+
+    async def _on_challstr(
+        self, session: ClientSession, ws: ClientWebSocketResponse, message: Message_challstr
+    ) -> Optional[ConnectionTermination]:
+        """Log in with the challstr, ending the connection if the login fails.
+
+        Args:
+            session (ClientSession): An aiohttp session to use for making requests as needed.
+            ws (ClientWebSocketResponse): The websocket connection to showdown.
+            message (Message_challstr): The challstr message to handle.
+
+        Returns:
+            Optional[ConnectionTermination]: Any connection termination information, if needed
+        """
+        try:
+            await self.send_login(session, ws, message)
+        except Exception as ex:
+            return ConnectionTermination(code=ConnectionTerminationCode.SETUP_ERROR, message=str(ex))
+
+        return None
+
     async def handle_updatesearch(
         self, session: ClientSession, ws: ClientWebSocketResponse, message: Message_updatesearch
     ) -> Optional[ConnectionTermination]:
@@ -272,12 +392,12 @@ class WebsocketConnector(Connector):
         Returns:
             Optional[ConnectionTermination]: Any connection termination information, if needed
         """
-        if len(self.completed_battles.keys()) >= self.total_battles and message.GAMES is None:
+        if len(self.completed_battles) >= self.total_battles and message.GAMES is None:
             # In this case we've completed the needed amount and all games are over
             return ConnectionTermination(
                 code=ConnectionTerminationCode.OBJECTIVE_COMPLETE, message="REQUIRED NUMBER OF GAMES COMPLETED"
             )
-        elif len(self.completed_battles.keys()) >= self.total_battles:
+        elif len(self.completed_battles) >= self.total_battles:
             # In this case we've somehow completed the necessary amt of battles but not all games are over?
             return None
         elif self.pending_battle_amt + self.active_battle_amt >= self.max_concurrent_battles:
@@ -290,7 +410,7 @@ class WebsocketConnector(Connector):
         elif self.objective == "challenge":
             # TODO: Add support for multiple formats
             for u in self.whitelist_users:
-                if u not in self.pending_challenges.keys():
+                if u not in self.pending_challenges:
                     await ws.send_str(f"|/challenge {u}, {self.target_format}")
                     self.pending_challenges[u] = self.target_format
                     self.pending_battle_amt += 1
@@ -349,7 +469,7 @@ class WebsocketConnector(Connector):
             r = await resp.text()
             r = json.loads(r[1:])
 
-            if "assertion" not in r.keys():
+            if "assertion" not in r:
                 raise RuntimeError(f"Failed to log in: {r}")
 
             token = r["assertion"]
@@ -377,13 +497,13 @@ class WebsocketConnector(Connector):
             Tuple[ProgressState, Optional[BattleState]]: The resulting progress state and battle state, if any.
                 If the battle has already concluded with a win/loss, the battle state will be None.
         """
-        if battle_id in self.completed_battles.keys():
+        if battle_id in self.completed_battles:
             return ProgressState.NO_ACTION, None
 
-        bp = self.battle_processors.get(
-            battle_id,
-            self.processor_class(session, self.showdown_username, self.showdown_username),
-        )
+        bp = self.battle_processors.get(battle_id)
+        if bp is None:
+            bp = self.processor_class(session, battle_id, self.showdown_username)
+            self.battle_processors[battle_id] = bp
 
         try:
             progress_state = await bp.process_message(message_str=message)
@@ -393,8 +513,6 @@ class WebsocketConnector(Connector):
             print(f"Battle {battle_id} ended due to an error: {type(ex)}: {ex}")
             bp.battle.error_end = True
 
-        self.battle_processors[battle_id] = bp
-
         return progress_state, bp.battle.battle_states[-1]
 
     async def process_action(
@@ -421,23 +539,15 @@ class WebsocketConnector(Connector):
         if progress_state == ProgressState.FULL_END:
             # Process any final logging / closing operations needed if any (e.g. resign from all ongoing battles)
             for bat_id, bp in self.battle_processors.items():
-                if bat_id in self.completed_battles.keys():
+                if bat_id in self.completed_battles:
                     continue
 
                 bp.log.append(">ABRUPT-ENDING: USER/OBJECTIVE REQUESTED SHUTDOWN")
 
-                await ws.send_str(f"{bat_id}|/forfeit")
-                await ws.send_str(f"{bat_id}|/leave")
-
-                if self.save_logs:
-                    os.makedirs(f"logs/{self.target_format}/", exist_ok=True)
-                    with open(f"logs/{self.target_format}/{bat_id}.log", "w", encoding="utf8") as f:
-                        f.writelines([f"{line}\n" for line in bp.log])
+                await self.send_commands(ws, bat_id, ["/forfeit", "/leave"])
 
-                if self.save_json:
-                    os.makedirs(f"logs/{self.target_format}/", exist_ok=True)
-                    with open(f"logs/{self.target_format}/{bat_id}.json", "w", encoding="utf8") as f:
-                        json.dump(bp.battle.model_dump(mode="json"), f)
+                if self.save_logs or self.save_json:
+                    await asyncio.to_thread(self.save_battle, bat_id, bp)
 
                 self.completed_battles[bat_id] = bp.battle
 
@@ -445,22 +555,16 @@ class WebsocketConnector(Connector):
         elif progress_state == ProgressState.GAME_END:
             # Process forfeit if needed
             if self.battle_processors[battle_id].battle.error_end:
-                await ws.send_str(f"{battle_id}|/forfeit")
-
-            await ws.send_str(f"{battle_id}|/leave")
+                await self.send_commands(ws, battle_id, ["/forfeit", "/leave"])
+            else:
+                await self.send_commands(ws, battle_id, ["/leave"])
 
             # Process game end movement
-            if self.save_logs:
-                os.makedirs(f"logs/{self.target_format}/", exist_ok=True)
-                with open(f"logs/{self.target_format}/{battle_id}.log", "w", encoding="utf8") as f:
-                    f.writelines([f"{line}\n" for line in self.battle_processors[battle_id].log])
+            bp = self.battle_processors.pop(battle_id)
+            if self.save_logs or self.save_json:
+                await asyncio.to_thread(self.save_battle, battle_id, bp)
 
-            if self.save_json:
-                os.makedirs(f"logs/{self.target_format}/", exist_ok=True)
-                with open(f"logs/{self.target_format}/{battle_id}.json", "w", encoding="utf8") as f:
-                    json.dump(self.battle_processors[battle_id].battle.model_dump(mode="json"), f)
-
-            self.completed_battles[battle_id] = self.battle_processors.pop(battle_id).battle
+            self.completed_battles[battle_id] = bp.battle
             return None
         else:
             # Verify/Submit the action to pokemon showdown
@@ -473,6 +577,51 @@ class WebsocketConnector(Connector):
             except Exception as ex:
                 return ConnectionTermination(code=ConnectionTerminationCode.OTHER_ERROR, message=f"{type(ex)}: {ex}")
 
+    def save_battle(self, battle_id: str, processor: ShowdownProcessor) -> None:
+        """Write a finished battle's log and/or json dump to the logs directory, per save_logs and save_json.
+
+        This does blocking file I/O, so process_action runs it in a worker thread with `asyncio.to_thread`, which keeps
+        the event loop free to handle the other battles' messages in the meantime. The processor must not be changed
+        while this runs, which holds since its battle is over.
+
+        Args:
+            battle_id (str): The id of the battle being saved, used as the file name.
+            processor (ShowdownProcessor): The processor holding the battle's log and Battle.
+        """
+        self.make_log_dir()
+
+        if self.save_logs:
+            with open(f"logs/{self.target_format}/{battle_id}.log", "w", encoding="utf8") as f:
+                if processor.log:
+                    f.write("\n".join(processor.log) + "\n")
+
+        if self.save_json:
+            with open(f"logs/{self.target_format}/{battle_id}.json", "wb") as f:
+                f.write(processor.battle.to_json_bytes())
+
+    def make_log_dir(self) -> None:
+        """Create the logs directory for the target format, if it hasn't been made by this connector already.
+
+        This is called before writing each completed battle's logs, so the directory is only checked on disk once per
+        format rather than once per file.
+        """
+        if self.target_format not in self.log_dirs_made:
+            os.makedirs(f"logs/{self.target_format}/", exist_ok=True)
+            self.log_dirs_made.add(self.target_format)
+
+    async def send_commands(self, ws: ClientWebSocketResponse, room_id: str, commands: List[str]) -> None:
+        """Send several commands to one showdown room in a single websocket frame.
+
+        Showdown runs each line of a message as its own command in the message's room, so joining the commands with
+        newlines costs one frame (and one write) instead of one per command.
+
+        Args:
+            ws (ClientWebSocketResponse): The websocket connection to showdown.
+            room_id (str): The room to send the commands to, e.g. a battle id. Use "" for the global room.
+            commands (List[str]): The commands to send, in order, e.g. ["/forfeit", "/leave"].
+        """
+        await ws.send_str(f"{room_id}|" + "\n".join(commands))
+
     async def submit_action(
         self,
         ws: ClientWebSocketResponse,
@@ -500,7 +649,7 @@ class WebsocketConnector(Connector):
             Optional[ConnectionTermination]: Any connection termination information, if needed
         """
         # Handle quit and resign options first since they are the simple cases
-        if is_bearable(action, QuitChoice):
+        if isinstance(action, QuitChoice):
             # Process all-resignation decision
             # TODO: Resign from all active games / close anything else as needed
 
@@ -508,7 +657,7 @@ class WebsocketConnector(Connector):
                 code=ConnectionTerminationCode.OTHER_ERROR,
                 message="USER REQUESTED SHUTDOWN",
             )
-        if is_bearable(action, ResignChoice):
+        if isinstance(action, ResignChoice):
             # Process resignation decision
             # TODO: Resign from just this game, don't return ConnectionTermination
             assert (
@@ -516,56 +665,31 @@ class WebsocketConnector(Connector):
             ), "battle_id was None but you sent a resignation! When not in a battle, send QuitChoice instead!"
             return
 
-        assert is_bearable(action, AnyChoice)
+        assert isinstance(action, _ANY_CHOICE_TYPES)
 
-        action_str = f"{battle_id}|/choose "
+        expected_choice = _SUBMIT_CHOICE_TYPES.get(progress_state)
+        if expected_choice is None:
+            assert action is None
+            return
 
-        if progress_state == ProgressState.TEAM_ORDER:
-            # Check valid formatting for team order submission:
-            assert is_bearable(action, TeamOrderChoice), f"action was not a valid TeamOrderChoice!\n{action}"
-            assert (
-                battle_id is not None
-            ), "battle_id was None! This likely means a bug in websocketconnector, not your code!"
+        # Check valid formatting for the choice this progress state asks for
+        choice_name, choice_types = expected_choice
+        assert isinstance(action, choice_types), f"action was not a valid {choice_name}!\n{action}"
+        assert (
+            battle_id is not None
+        ), "battle_id was None! This likely means a bug in websocketconnector, not your code!"
 
-            # TeamOrderChoice can either be a TeamChoice or a DefaultChoice, easy
-            action_str += action.to_showdown()
-        elif progress_state == ProgressState.SWITCH:
-            # Check valid formatting for force-switch submission:
-            assert is_bearable(action, ForceSwitchChoice), f"action was not a valid ForceSwitchChoice!\n{action}"
-            assert (
-                battle_id is not None
-            ), "battle_id was None! This likely means a bug in websocketconnector, not your code!"
-
-            # ForceSwitchChoice can either be a List of either Switch/Pass choices, or a single DefaultChoice
-            if is_bearable(action, list):
-                assert (
-                    (self.gametype == "singles" and len(action) == 1)
-                    or (self.gametype == "doubles" and len(action) == 2)
-                    or (self.gametype == "triples" and len(action) == 3)
-                ), f"gametype is {self.gametype}, but you sent {len(action)} commands!"
-                action_str += ",".join([sub_action.to_showdown() for sub_action in action])
-            else:
-                action_str += action.to_showdown()
-        elif progress_state == ProgressState.MOVE:
-            # Check valid formatting for move submission:
-            assert is_bearable(action, MoveDecisionChoice), f"action was not a valid MoveDecisionChoice!\n{action}"
+        action_str = f"{battle_id}|/choose "
+
+        # ForceSwitchChoice and MoveDecisionChoice can either be a List of per-slot choices, or a single choice
+        # TeamOrderChoice is always a single choice, either a TeamChoice or a DefaultChoice
+        if isinstance(action, list):
             assert (
-                battle_id is not None
-            ), "battle_id was None! This likely means a bug in websocketconnector, not your code!"
-
-            # ForceSwitchChoice can either be a List of Move/Switch/Pass choices, or a single DefaultChoice
-            if is_bearable(action, list):
-                assert (
-                    (self.gametype == "singles" and len(action) == 1)
-                    or (self.gametype == "doubles" and len(action) == 2)
-                    or (self.gametype == "triples" and len(action) == 3)
-                ), f"gametype is {self.gametype}, but you sent {len(action)} commands!"
-                action_str += ",".join([sub_action.to_showdown() for sub_action in action])
-            else:
-                action_str += action.to_showdown()
+                len(action) == self.slot_length
+            ), f"gametype is {self.gametype}, but you sent {len(action)} commands!"
+            action_str += ",".join([sub_action.to_showdown() for sub_action in action])
         else:
-            assert action is None
-            return
+            action_str += action.to_showdown()
 
         await self.battle_processors[battle_id].process_action(action, action_str)
         await ws.send_str(action_str)
@@ -11,11 +11,22 @@ from copy import deepcopy
 from poketypes.dex import clean_forme, DexStatus
 from poketypes.showdown import battlemessage, BattleMessage, BMType
 
-from ..battle import BattleAbility, BattleItem, BattleMove, BattlePokemon, BattleState, StatBlock
+from ..battle import (
+    BattleAbility,
+    BattleItem,
+    BattleMove,
+    BattlePokemon,
+    Gametype,
+    StatBlock,
+    pokemon_id,
+)
 from ..battle.choices import MoveChoice, PassChoice, SwitchChoice, TeamChoice, AnyChoice
 from ..battle.utilities import get_valid_target_slots, needs_target
 from .abstractprocessor import Processor, ProgressState
 
+# Showdown identifies battle slots by letter, while the BattleState slot maps are keyed by number
+_SLOT_NUMBERS = {"a": 1, "b": 2, "c": 3}
+
 
 class ShowdownProcessor(Processor):
     """Processor class for showdown-style messages. Built to work for showdown-style battle messages exclusively.
@@ -460,17 +471,10 @@ class ShowdownProcessor(Processor):
         Args:
             bm (battlemessage.BattleMessage_gametype): The battlemessage, after being parsed as a BattleMessage.
         """
-        self.battle.gametype = bm.GAMETYPE
+        self.battle.gametype = Gametype.from_showdown(bm.GAMETYPE)
 
-        if bm.GAMETYPE == "singles":
-            self.battle.battle_states[-1].player_slots = {1: None}
-            self.battle.battle_states[-1].opponent_slots = {1: None}
-        elif bm.GAMETYPE == "doubles":
-            self.battle.battle_states[-1].player_slots = {1: None, 2: None}
-            self.battle.battle_states[-1].opponent_slots = {1: None, 2: None}
-        elif bm.GAMETYPE == "triples":
-            self.battle.battle_states[-1].player_slots = {1: None, 2: None, 3: None}
-            self.battle.battle_states[-1].opponent_slots = {1: None, 2: None, 3: None}
+        self.battle.battle_states[-1].player_slots = {slot: None for slot in range(1, self.battle.gametype + 1)}
+        self.battle.battle_states[-1].opponent_slots = {slot: None for slot in range(1, self.battle.gametype + 1)}
 
     async def processbm_gen(self, bm: battlemessage.BattleMessage_gen) -> None:
         """Process the BattleMessage, updating the BattleState.
@@ -588,7 +592,7 @@ class ShowdownProcessor(Processor):
                     min_defence=bm_poke.STATS["def"],
                     max_defence=bm_poke.STATS["def"],
                     min_spattack=bm_poke.STATS["spa"],
-                    max_apattack=bm_poke.STATS["spa"],
+                    max_spattack=bm_poke.STATS["spa"],
                     min_spdefence=bm_poke.STATS["spd"],
                     max_spdefence=bm_poke.STATS["spd"],
                     min_speed=bm_poke.STATS["spe"],
@@ -621,7 +625,7 @@ class ShowdownProcessor(Processor):
 
                 current_state.player_team[poke.to_base_id()] = poke
             else:
-                poke_id = f"{bm.PLAYER}_{clean_forme(bm_poke.SPECIES)}_{bm_poke.GENDER}_{bm_poke.IDENT.IDENTITY}"
+                poke_id = pokemon_id(bm.PLAYER, clean_forme(bm_poke.SPECIES), bm_poke.GENDER, bm_poke.IDENT.IDENTITY)
                 poke = current_state.player_team[poke_id]
 
                 poke.max_hp = bm_poke.MAX_HP if bm_poke.MAX_HP is not None else poke.max_hp
@@ -784,7 +788,7 @@ class ShowdownProcessor(Processor):
         self.battle.turn = bm.NUMBER
 
         # We need to process valid targets here, as this will happen `after` any switches are made
-        if self.battle.gametype == "singles":
+        if self.battle.gametype == Gametype.SINGLES:
             return
 
         cur_state = self.battle.battle_states[-1]
@@ -807,7 +811,7 @@ class ShowdownProcessor(Processor):
                         continue
 
                     targettable_list = get_valid_target_slots(
-                        -1 * (e + 1), filled_slots, slot_choice.target_type, self.battle.gametype
+                        -1 * (e + 1), filled_slots, slot_choice.target_type, self.battle.gametype.to_showdown()
                     )
                     for target_slot in targettable_list:
                         m = MoveChoice(
@@ -875,43 +879,47 @@ class ShowdownProcessor(Processor):
         # Maybe a numbering system based on appearance?
         # Current setup relies on perfect accounting of slot information
 
-        full_ident = f"{bm.POKEMON.PLAYER}_{clean_forme(bm.SPECIES)}_{bm.GENDER}_{bm.POKEMON.IDENTITY}"
-        base_ident = f"{bm.POKEMON.PLAYER}_{clean_forme(bm.SPECIES)}_{bm.GENDER}_None"
+        full_ident = pokemon_id(bm.POKEMON.PLAYER, clean_forme(bm.SPECIES), bm.GENDER, bm.POKEMON.IDENTITY)
+        base_ident = pokemon_id(bm.POKEMON.PLAYER, clean_forme(bm.SPECIES), bm.GENDER, None)
 
         slot = bm.POKEMON.SLOT
         assert slot is not None
 
-        slot = "abc".find(slot) + 1
+        slot = _SLOT_NUMBERS[slot]
 
         current_state = self.battle.battle_states[-1]
 
-        if full_ident in current_state.player_team.keys():
+        if full_ident in current_state.player_team:
             # Check if there was already a pokemon in this slot, and if so, update its slot and active status
             if current_state.player_slots[slot] is not None:
                 old_poke_id = current_state.player_slots[slot]
-                current_state.player_team[old_poke_id].slot = None
-                current_state.player_team[old_poke_id].active = False
+                old_poke = current_state.player_team[old_poke_id]
+                old_poke.slot = None
+                old_poke.active = False
             else:
                 old_poke_id = None
 
-            current_state.player_team[full_ident].slot = slot
-            current_state.player_team[full_ident].active = True
+            poke = current_state.player_team[full_ident]
+            poke.slot = slot
+            poke.active = True
             current_state.player_slots[slot] = full_ident
 
             self.log.append(f"# In slot {slot}, swapping out {old_poke_id} for {full_ident}")
             self.log.append("# " + ",".join([f"{k} - {v}" for k, v in current_state.player_slots.items()]))
-        elif full_ident in current_state.opponent_team.keys():
+        elif full_ident in current_state.opponent_team:
             # Process this as an opponent slot switch
             # This also means this is a pokemon we have seen before from the opponent
             if current_state.opponent_slots[slot] is not None:
                 old_poke_id = current_state.opponent_slots[slot]
-                current_state.opponent_team[old_poke_id].slot = None
-                current_state.opponent_team[old_poke_id].active = False
+                old_poke = current_state.opponent_team[old_poke_id]
+                old_poke.slot = None
+                old_poke.active = False
 
-            current_state.opponent_team[full_ident].slot = slot
-            current_state.opponent_team[full_ident].active = True
+            poke = current_state.opponent_team[full_ident]
+            poke.slot = slot
+            poke.active = True
             current_state.opponent_slots[slot] = full_ident
-        elif base_ident in current_state.opponent_team.keys():
+        elif base_ident in current_state.opponent_team:
             # Process this as an opponent slot switch
             # This also means this is a pokemon we have not yet seen before from the opponent
             poke = current_state.opponent_team.pop(base_ident)
@@ -921,11 +929,13 @@ class ShowdownProcessor(Processor):
 
             if current_state.opponent_slots[slot] is not None:
                 old_poke_id = current_state.opponent_slots[slot]
-                current_state.opponent_team[old_poke_id].slot = None
-                current_state.opponent_team[old_poke_id].active = False
+                old_poke = current_state.opponent_team[old_poke_id]
+                old_poke.slot = None
+                old_poke.active = False
 
-            current_state.opponent_team[full_ident].slot = slot
-            current_state.opponent_team[full_ident].active = True
+            poke = current_state.opponent_team[full_ident]
+            poke.slot = slot
+            poke.active = True
             current_state.opponent_slots[slot] = full_ident
         else:
             # In this case, we must be playing without teampreview, since we haven't seen this before
@@ -949,11 +959,13 @@ class ShowdownProcessor(Processor):
             # Process this as an opponent slot switch
             if current_state.opponent_slots[slot] is not None:
                 old_poke_id = current_state.opponent_slots[slot]
-                current_state.opponent_team[old_poke_id].slot = None
-                current_state.opponent_team[old_poke_id].active = False
+                old_poke = current_state.opponent_team[old_poke_id]
+                old_poke.slot = None
+                old_poke.active = False
 
-            current_state.opponent_team[full_ident].slot = slot
-            current_state.opponent_team[full_ident].active = True
+            poke = current_state.opponent_team[full_ident]
+            poke.slot = slot
+            poke.active = True
             current_state.opponent_slots[slot] = full_ident
 
         self.battle.battle_states[-1] = current_state
@@ -968,43 +980,47 @@ class ShowdownProcessor(Processor):
         Args:
             bm (battlemessage.BattleMessage_drag): The battlemessage, after being parsed as a BattleMessage.
         """
-        full_ident = f"{bm.POKEMON.PLAYER}_{clean_forme(bm.SPECIES)}_{bm.GENDER}_{bm.POKEMON.IDENTITY}"
-        base_ident = f"{bm.POKEMON.PLAYER}_{clean_forme(bm.SPECIES)}_{bm.GENDER}_None"
+        full_ident = pokemon_id(bm.POKEMON.PLAYER, clean_forme(bm.SPECIES), bm.GENDER, bm.POKEMON.IDENTITY)
+        base_ident = pokemon_id(bm.POKEMON.PLAYER, clean_forme(bm.SPECIES), bm.GENDER, None)
 
         slot = bm.POKEMON.SLOT
         assert slot is not None
 
-        slot = "abc".find(slot) + 1
+        slot = _SLOT_NUMBERS[slot]
 
         current_state = self.battle.battle_states[-1]
 
-        if full_ident in current_state.player_team.keys():
+        if full_ident in current_state.player_team:
             # Process this as a player slot switch
             if current_state.player_slots[slot] is not None:
                 old_poke_id = current_state.player_slots[slot]
-                current_state.player_team[old_poke_id].slot = None
-                current_state.player_team[old_poke_id].active = False
+                old_poke = current_state.player_team[old_poke_id]
+                old_poke.slot = None
+                old_poke.active = False
             else:
                 old_poke_id = None
 
-            current_state.player_team[full_ident].slot = slot
-            current_state.player_team[full_ident].active = True
+            poke = current_state.player_team[full_ident]
+            poke.slot = slot
+            poke.active = True
             current_state.player_slots[slot] = full_ident
 
             self.log.append(f"# In slot {slot}, swapping out {old_poke_id} for {full_ident}")
             self.log.append("# " + ",".join([f"{k} - {v}" for k, v in current_state.player_slots.items()]))
-        elif full_ident in current_state.opponent_team.keys():
+        elif full_ident in current_state.opponent_team:
             # Process this as an opponent slot switch
             # This also means this is a pokemon we have seen before from the opponent
             if current_state.opponent_slots[slot] is not None:
                 old_poke_id = current_state.opponent_slots[slot]
-                current_state.opponent_team[old_poke_id].slot = None
-                current_state.opponent_team[old_poke_id].active = False
+                old_poke = current_state.opponent_team[old_poke_id]
+                old_poke.slot = None
+                old_poke.active = False
 
-            current_state.opponent_team[full_ident].slot = slot
-            current_state.opponent_team[full_ident].active = True
+            poke = current_state.opponent_team[full_ident]
+            poke.slot = slot
+            poke.active = True
             current_state.opponent_slots[slot] = full_ident
-        elif base_ident in current_state.opponent_team.keys():
+        elif base_ident in current_state.opponent_team:
             # Process this as an opponent slot switch
             # This also means this is a pokemon we have not yet seen before from the opponent
             poke = current_state.opponent_team.pop(base_ident)
@@ -1014,11 +1030,13 @@ class ShowdownProcessor(Processor):
 
             if current_state.opponent_slots[slot] is not None:
                 old_poke_id = current_state.opponent_slots[slot]
-                current_state.opponent_team[old_poke_id].slot = None
-                current_state.opponent_team[old_poke_id].active = False
+                old_poke = current_state.opponent_team[old_poke_id]
+                old_poke.slot = None
+                old_poke.active = False
 
-            current_state.opponent_team[full_ident].slot = slot
-            current_state.opponent_team[full_ident].active = True
+            poke = current_state.opponent_team[full_ident]
+            poke.slot = slot
+            poke.active = True
             current_state.opponent_slots[slot] = full_ident
         else:
             # In this case, we must be playing without teampreview, since we haven't seen this before
@@ -1042,11 +1060,13 @@ class ShowdownProcessor(Processor):
             # Process this as an opponent slot switch
             if current_state.opponent_slots[slot] is not None:
                 old_poke_id = current_state.opponent_slots[slot]
-                current_state.opponent_team[old_poke_id].slot = None
-                current_state.opponent_team[old_poke_id].active = False
+                old_poke = current_state.opponent_team[old_poke_id]
+                old_poke.slot = None
+                old_poke.active = False
 
-            current_state.opponent_team[full_ident].slot = slot
-            current_state.opponent_team[full_ident].active = True
+            poke = current_state.opponent_team[full_ident]
+            poke.slot = slot
+            poke.active = True
             current_state.opponent_slots[slot] = full_ident
 
         self.battle.battle_states[-1] = current_state
@@ -1061,12 +1081,12 @@ class ShowdownProcessor(Processor):
         Args:
             bm (battlemessage.BattleMessage_detailschange): The battlemessage, after being parsed as a BattleMessage.
         """
-        full_ident = f"{bm.POKEMON.PLAYER}_{clean_forme(bm.SPECIES)}_{bm.GENDER}_{bm.POKEMON.IDENTITY}"
+        full_ident = pokemon_id(bm.POKEMON.PLAYER, clean_forme(bm.SPECIES), bm.GENDER, bm.POKEMON.IDENTITY)
 
         slot = bm.POKEMON.SLOT
         assert slot is not None
 
-        slot = "abc".find(slot) + 1
+        slot = _SLOT_NUMBERS[slot]
 
         current_state = self.battle.battle_states[-1]
 
@@ -1112,12 +1132,12 @@ class ShowdownProcessor(Processor):
         # At bare minimum, we need to correct the slot information. Ideally we would also backtrack here and update
         # all of the information we have learned for the old_slot_poke and move it to the new_slot_poke
 
-        full_ident = f"{bm.POKEMON.PLAYER}_{clean_forme(bm.SPECIES)}_{bm.GENDER}_{bm.POKEMON.IDENTITY}"
+        full_ident = pokemon_id(bm.POKEMON.PLAYER, clean_forme(bm.SPECIES), bm.GENDER, bm.POKEMON.IDENTITY)
 
         slot = bm.POKEMON.SLOT
         assert slot is not None
 
-        slot = "abc".find(slot) + 1
+        slot = _SLOT_NUMBERS[slot]
 
         current_state = self.battle.battle_states[-1]
 
@@ -1162,9 +1182,9 @@ class ShowdownProcessor(Processor):
 
             current_state.opponent_slots[slot] = full_ident
 
-            if full_ident not in current_state.opponent_team.keys():
-                base_ident = f"{bm.POKEMON.PLAYER}_{clean_forme(bm.SPECIES)}_{bm.GENDER}_None"
-                assert base_ident in current_state.opponent_team.keys(), "Failed to setup team before replace occured"
+            if full_ident not in current_state.opponent_team:
+                base_ident = pokemon_id(bm.POKEMON.PLAYER, clean_forme(bm.SPECIES), bm.GENDER, None)
+                assert base_ident in current_state.opponent_team, "Failed to setup team before replace occured"
 
                 poke = current_state.opponent_team.pop(base_ident)
                 poke.base_species = clean_forme(bm.SPECIES)
@@ -1192,7 +1212,7 @@ class ShowdownProcessor(Processor):
         original_slot = bm.POKEMON.SLOT
         assert original_slot is not None
 
-        original_slot = "abc".find(original_slot) + 1
+        original_slot = _SLOT_NUMBERS[original_slot]
         new_slot = bm.POSITION + 1
 
         current_state = self.battle.battle_states[-1]
@@ -1244,7 +1264,7 @@ class ShowdownProcessor(Processor):
         slot = bm.POKEMON.SLOT
         assert slot is not None
 
-        slot = "abc".find(slot) + 1
+        slot = _SLOT_NUMBERS[slot]
 
         if bm.POKEMON.PLAYER == self.battle.player_id:
             # Process this as a player update
@@ -1252,9 +1272,10 @@ class ShowdownProcessor(Processor):
 
             poke_id = current_state.player_slots[slot]
 
-            current_state.player_team[poke_id].status = DexStatus.STATUS_FNT
-            current_state.player_team[poke_id].active = False
-            current_state.player_team[poke_id].slot = None
+            poke = current_state.player_team[poke_id]
+            poke.status = DexStatus.STATUS_FNT
+            poke.active = False
+            poke.slot = None
 
             current_state.player_slots[slot] = None
         else:
@@ -1263,9 +1284,10 @@ class ShowdownProcessor(Processor):
 
             poke_id = current_state.opponent_slots[slot]
 
-            current_state.opponent_team[poke_id].status = DexStatus.STATUS_FNT
-            current_state.opponent_team[poke_id].active = False
-            current_state.opponent_team[poke_id].slot = None
+            poke = current_state.opponent_team[poke_id]
+            poke.status = DexStatus.STATUS_FNT
+            poke.active = False
+            poke.slot = None
 
             current_state.opponent_slots[slot] = None
 
@@ -1436,7 +1458,7 @@ class ShowdownProcessor(Processor):
         current_state = self.battle.battle_states[-1]
 
         slot = bm.POKEMON.SLOT
-        slot = "abc".find(slot) + 1
+        slot = _SLOT_NUMBERS[slot]
 
         if bm.POKEMON.PLAYER == self.battle.player_id:
             # Process this as a player update
@@ -1444,8 +1466,9 @@ class ShowdownProcessor(Processor):
 
             poke_id = current_state.player_slots[slot]
 
-            current_state.player_team[poke_id].tera_type = bm.TYPE
-            current_state.player_team[poke_id].is_tera = True
+            poke = current_state.player_team[poke_id]
+            poke.tera_type = bm.TYPE
+            poke.is_tera = True
             current_state.player_has_teratyped = True
         else:
             # Process this as a opponent update
@@ -1453,8 +1476,9 @@ class ShowdownProcessor(Processor):
 
             poke_id = current_state.opponent_slots[slot]
 
-            current_state.opponent_team[poke_id].tera_type = bm.TYPE
-            current_state.opponent_team[poke_id].is_tera = True
+            poke = current_state.opponent_team[poke_id]
+            poke.tera_type = bm.TYPE
+            poke.is_tera = True
             current_state.opponent_has_teratyped = True
 
         self.battle.battle_states[-1] = current_state
@@ -1581,7 +1605,7 @@ class ShowdownProcessor(Processor):
         current_state = self.battle.battle_states[-1]
 
         slot = bm.POKEMON.SLOT
-        slot = "abc".find(slot) + 1
+        slot = _SLOT_NUMBERS[slot]
 
         if bm.POKEMON.PLAYER == self.battle.player_id:
             # Process this as a player update
@@ -1589,8 +1613,9 @@ class ShowdownProcessor(Processor):
 
             poke_id = current_state.player_slots[slot]
 
-            current_state.player_team[poke_id].is_mega = True
-            current_state.player_team[poke_id].possible_items = [BattleItem(name=bm.MEGA_STONE, probability=1.0)]
+            poke = current_state.player_team[poke_id]
+            poke.is_mega = True
+            poke.possible_items = [BattleItem(name=bm.MEGA_STONE, probability=1.0)]
             current_state.player_has_megad = True
         else:
             # Process this as a opponent update
@@ -1598,8 +1623,9 @@ class ShowdownProcessor(Processor):
 
             poke_id = current_state.opponent_slots[slot]
 
-            current_state.opponent_team[poke_id].is_mega = True
-            current_state.opponent_team[poke_id].possible_items = [BattleItem(name=bm.MEGA_STONE, probability=1.0)]
+            poke = current_state.opponent_team[poke_id]
+            poke.is_mega = True
+            poke.possible_items = [BattleItem(name=bm.MEGA_STONE, probability=1.0)]
             current_state.opponent_has_megad = True
 
         self.battle.battle_states[-1] = current_state
@@ -1774,7 +1800,7 @@ class ShowdownProcessor(Processor):
             bm (battlemessage.BattleMessage_init): The battlemessage, after being parsed as a BattleMessage.
         """
         # This signifies that the game has started, so we need to initialize our first state
-        bs = BattleState(turn=1)
+        bs = self.BATTLE_STATE_CLASS.from_trusted({"turn": 1})
         self.battle.battle_states.append(bs)
 
     async def processbm_title(self, bm: battlemessage.BattleMessage_title) -> None:
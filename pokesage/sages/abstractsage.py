@@ -1,5 +1,6 @@
 """Abstract Sage class for other player classes to implement with their decision functions."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional, List
 from tqdm.asyncio import tqdm
@@ -76,6 +77,20 @@ class AbstractSage(ABC):
         if self.use_tqdm:
             pbar.close()
 
+    def run(self) -> None:
+        """Run `launch` to completion in a new event loop, blocking until the sage is done playing.
+
+        If uvloop is installed (e.g. with `pip install pokesage[fast]`), its libuv-based event loop is used, which
+        handles websocket I/O with less overhead than the default asyncio loop. Otherwise this is the same as
+        `asyncio.run(sage.launch())`.
+        """
+        try:
+            import uvloop
+        except ImportError:
+            asyncio.run(self.launch())
+        else:
+            uvloop.run(self.launch())
+
     async def play(self, session: ClientSession, pbar: Optional[tqdm]) -> None:
         """Launch the connector, and begin processing action requests.
 
@@ -115,7 +130,7 @@ class AbstractSage(ABC):
                 # This tells us that the connection itself has been ended
                 action = None
 
-                print(data.model_dump_json(indent=2))
+                print(data)
 
                 break
             else:
@@ -16,7 +16,6 @@ from ..battle.choices import (
 from ..battle.state import BattleState
 from .abstractsage import AbstractSage
 
-from beartype.door import is_bearable
 import random
 
 
@@ -40,11 +39,11 @@ class RandomSage(AbstractSage):
         """
         # TODO: Implement random sub-team ordering (ex: of the 6 options, pick 4)
 
-        assert is_bearable(
+        assert isinstance(
             battle_state.battle_choice, TeamChoice
         ), f"Expected to receive a TeamChoice to decide from but got: {type(battle_state.battle_choice)} instead!"
 
-        team_order = battle_state.battle_choice.team_order
+        team_order = list(battle_state.battle_choice.team_order)
 
         random.shuffle(team_order)
 
@@ -63,11 +62,11 @@ class RandomSage(AbstractSage):
         Returns:
             MoveDecisionChoice: A randomly selected move for each slot
         """
-        assert is_bearable(battle_state.battle_choice, list), "The given choices should be a list!"
+        assert isinstance(battle_state.battle_choice, list), "The given choices should be a list!"
 
         selected_choices = []
         for slot_choices in battle_state.battle_choice:
-            if is_bearable(slot_choices, PassChoice):
+            if isinstance(slot_choices, PassChoice):
                 selected_choices.append(slot_choices)
             else:
                 valid_choices = self.clean_choices(selected_choices, slot_choices)
@@ -93,11 +92,11 @@ class RandomSage(AbstractSage):
         Returns:
             ForceSwitchChoice: A randomly selected switch for each slot, as needed.
         """
-        assert is_bearable(battle_state.battle_choice, list), "The given choices should be a list!"
+        assert isinstance(battle_state.battle_choice, list), "The given choices should be a list!"
 
         selected_choices = []
         for slot_choices in battle_state.battle_choice:
-            if is_bearable(slot_choices, PassChoice):
+            if isinstance(slot_choices, PassChoice):
                 selected_choices.append(slot_choices)
             else:
                 valid_choices = self.clean_choices(selected_choices, slot_choices)